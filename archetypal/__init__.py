@@ -5,6 +5,10 @@
 # Web: https://github.com/samuelduchesne/archetypal
 ################################################################################
 
+import importlib
+import os
+import warnings
+
 # Version of the package
 from pkg_resources import get_distribution, DistributionNotFound
 
@@ -14,23 +18,56 @@ except DistributionNotFound:
     # package is not installed
     __version__ = "0.0.0"  # should happen only if package is copied, not installed.
 else:
-    # warn if a newer version of archetypal is available
-    from outdated import warn_if_outdated
-    from .eplus_interface.version import warn_if_not_compatible
-finally:
-    # warn if energyplus not installed or incompatible
-    from .eplus_interface.version import warn_if_not_compatible
+    # warn if a newer version of archetypal is available. Opt-in since it
+    # requires network access.
+    if os.environ.get("ARCHETYPAL_CHECK_UPDATES") == "1":
+        from outdated import warn_if_outdated
 
-    warn_if_not_compatible()
+        warn_if_outdated("archetypal", __version__)
 
 # don't display futurewarnings
 
-import warnings
-
 warnings.simplefilter(action="ignore", category=FutureWarning)
 warnings.simplefilter(action="ignore", category=UserWarning)
 
-from .idfclass import IDF
-from .eplus_interface.version import EnergyPlusVersion
-from .umi_template import UmiTemplateLibrary
-from .utils import config
+# Public objects are imported from their module on first access (PEP 562), so that
+# `import archetypal` does not load the whole package.
+_LAZY = {
+    "IDF": ".idfclass",
+    "EnergyPlusVersion": ".eplus_interface.version",
+    "UmiTemplateLibrary": ".umi_template",
+    "config": ".utils",
+}
+__all__ = list(_LAZY)
+_compatibility_checked = False
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        # Submodules (eg.: archetypal.settings) are also imported on first access.
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    global _compatibility_checked
+    if not _compatibility_checked:
+        _compatibility_checked = True
+        # warn if energyplus not installed or incompatible
+        from .eplus_interface.version import warn_if_not_compatible
+
+        with warnings.catch_warnings():
+            warnings.simplefilter(action="default", category=UserWarning)
+            warn_if_not_compatible()
+
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -1,20 +1,26 @@
 """Transition module."""
 
+import asyncio
+import atexit
+import bisect
+import errno
+import functools
 import logging as lg
+import multiprocessing
 import os
 import platform
 import re
 import shutil
-import subprocess
+import sys
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import StringIO
 from subprocess import CalledProcessError
-from threading import Thread
+from threading import Lock
+from typing import Optional
 
-from eppy.runner.run_functions import paths_from_version
 from path import Path
-from tqdm.auto import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm
 
 from archetypal.eplus_interface.energy_plus import EnergyPlusProgram
 from archetypal.eplus_interface.exceptions import (
@@ -22,7 +28,26 @@ from archetypal.eplus_interface.exceptions import (
     EnergyPlusVersionError,
 )
 from archetypal.eplus_interface.version import EnergyPlusVersion
-from archetypal.utils import log
+from archetypal import settings
+from archetypal.utils import config, log
+
+# Shared pool on which transitions are run. Created lazily by _get_executor().
+_EXECUTOR = None
+_EXECUTOR_LOCK = Lock()
+
+# Size of the stdout/stderr pipes of the transition programs. Larger than the
+# default 64 KiB Linux pipe so that log bursts do not block the child process.
+# Only requested from Python 3.10, where Popen accepts a pipesize.
+_PIPE_SIZE = 1 << 20
+
+# Matches the target version of a transition program, eg.: "9-2-0" in
+# "Transition-V9-1-0-to-V9-2-0".
+_TRANS_RE = re.compile(r"to-V(\d-\d-\d)")
+
+# Created in a running directory once it holds the transition programs.
+_READY_SENTINEL = ".trans_exec.ready"
+_RETRIES = 3  # attempts at linking a file that transiently disappears
+_LARGE_FILE = 1 << 20  # bytes; larger files are copied without their metadata
 
 
 class TransitionExe(EnergyPlusProgram):
@@ -41,13 +66,24 @@ class TransitionExe(EnergyPlusProgram):
         self.trans = None  # Set by __next__()
         self.running_directory = tmp_dir
 
+        self._idfname = None  # Set by idfname
         self._trans_exec = None
+        self._sorted_versions = None  # Set by trans_exec
+        self._transitions = None  # Set by _ensure()
+        self._it = None
 
     def __next__(self):
         """Return next transition."""
-        self.trans = next(self.transitions_generator)
+        self._ensure()
+        self.trans = next(self._it)
         return self
 
+    def _ensure(self):
+        """Compute the necessary transitions once for the whole iteration."""
+        if self._transitions is None:
+            self._transitions = self.transitions
+            self._it = iter(self._transitions)
+
     def __iter__(self):
         """Iterate over transitions."""
         return self
@@ -71,46 +107,33 @@ class TransitionExe(EnergyPlusProgram):
 
     @property
     def idfname(self):
-        """Copy and return self.idf to the output directory and expand."""
-        return Path(self.idf.savecopy(self.running_directory / "in.idf")).expand()
+        """Copy and return self.idf to the output directory and expand.
+
+        The copy is made once; the transitioned files then replace it in place
+        (see :meth:`TransitionThread._run_async`).
+        """
+        if self._idfname is None:
+            self._idfname = Path(
+                self.idf.savecopy(self.running_directory / "in.idf")
+            ).expand()
+        return self._idfname
 
     @property
     def trans_exec(self) -> dict:
         """Return dict of {EnergyPlusVersion: executable} for each transitions."""
-
-        def copytree(src, dst, symlinks=False, ignore=None):
-            for item in os.listdir(src):
-                s = os.path.join(src, item)
-                d = os.path.join(dst, item)
-                try:
-                    if os.path.isdir(s):
-                        shutil.copytree(s, d, symlinks, ignore)
-                    else:
-                        shutil.copy2(s, d)
-                except FileNotFoundError as e:
-                    time.sleep(60)
-                    log(f"{e}")
-
         if self._trans_exec is None:
-            copytree(self.idf.idfversionupdater_dir, self.running_directory)
-            self._trans_exec = {
-                EnergyPlusVersion(
-                    re.search(r"to-V(([\d])-([\d])-([\d]))", exec).group(1)
-                ): exec
-                for exec in self.running_directory.files("Transition-V*")
-            }
+            existing = _populate(self.idf.idfversionupdater_dir, self.running_directory)
+            self._trans_exec = _by_version(existing)
+            self._sorted_versions = list(self._trans_exec)
         return self._trans_exec
 
     @property
     def transitions(self) -> list:
         """Return a sorted list of necessary transitions."""
-        transitions = [
-            key
-            for key in self.trans_exec
-            if self.idf.as_version >= key > self.idf.file_version
-        ]
-        transitions.sort()
-        return transitions
+        self.trans_exec  # sorts the available versions on first access
+        return _select_transitions(
+            self._sorted_versions, self.idf.file_version, self.idf.as_version
+        )
 
     @property
     def transitions_generator(self):
@@ -128,7 +151,7 @@ class TransitionExe(EnergyPlusProgram):
 
     def cmd(self):
         """Get the platform-specific command."""
-        _which = Path(shutil.which(self.get_exe_path()))
+        _which = Path(_resolve_which(self.get_exe_path()))
         if platform.system() == "Windows":
             cmd = [_which.relpath(), self.idfname.basename()]
         else:
@@ -137,12 +160,15 @@ class TransitionExe(EnergyPlusProgram):
         return cmd
 
 
-class TransitionThread(Thread):
-    """Transition program manager."""
+class TransitionThread:
+    """Transition program manager.
+
+    Not a :class:`threading.Thread`: :meth:`run` is called directly, eg.: by a
+    worker of the shared transition pool (see :func:`submit_transition`).
+    """
 
     def __init__(self, idf, tmp, overwrite=False):
-        """Initialize Thread."""
-        super(TransitionThread, self).__init__()
+        """Initialize the transition of idf in tmp."""
         self.overwrite = overwrite
         self.p = None
         self.std_out = None
@@ -160,53 +186,62 @@ class TransitionThread(Thread):
     def run(self):
         """Run.
 
-        Wrapper around the EnergyPlus command line interface.
+        Wrapper around the EnergyPlus command line interface. Drives
+        :meth:`_run_async` on its own event loop.
         """
+        asyncio.run(self._run_async())
+
+    async def _run_async(self):
+        """Run the transition programs as asyncio subprocesses.
+
+        Both pipes of the child processes are read concurrently, and the blocking
+        file operations run on worker threads.
+        """
+        from tqdm.auto import tqdm
+        from tqdm.contrib.logging import logging_redirect_tqdm
+
         self.cancelled = False
         # get version from IDF object or by parsing the IDF file for it
-
-        # Move files into place
+        loop = asyncio.get_running_loop()
         tmp = self.tmp
-        self.idfname = Path(self.idf.savecopy(tmp / "in.idf")).expand()
-        self.idd = self.idf.iddname.copy(tmp).expand()
-
         generator = TransitionExe(self.idf, tmp_dir=tmp)
 
+        # Move files into place. Copying is blocking I/O: it runs on a worker
+        # thread so that the event loop keeps supervising running transitions.
+        await loop.run_in_executor(None, self._stage_files, generator)
+
         # set the initial version from which we are transitioning
-        last_successful_transition = self.idf.file_version
+        initial_version = last_successful_transition = self.idf.file_version
 
+        generator._ensure()
+        # Get executable using shutil.which (determines the extension
+        # based on the platform, eg: .exe. And copy the executable to tmp
+        self.run_dir = Path(tmp).expand()
         with logging_redirect_tqdm(loggers=[lg.getLogger(self.idf.name)]):
             for trans in tqdm(
                 generator,
-                total=len(generator.transitions),
+                total=len(generator._transitions),
                 unit_scale=True,
-                miniters=1,
+                mininterval=0.5,
                 position=self.idf.position,
                 desc=f"Transition #{self.idf.position}-{self.idf.name}",
             ):
-                # Get executable using shutil.which (determines the extension
-                # based on the platform, eg: .exe. And copy the executable to tmp
-                self.run_dir = Path(tmp).expand()
-
                 # Run Transition Program
                 self.cmd = trans.cmd()
-                self.p = subprocess.Popen(
-                    self.cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    shell=False,  # cannot use shell
+                popen_kwargs = dict(
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                     cwd=self.run_dir,
                 )
+                if platform.system() != "Windows" and sys.version_info >= (3, 10):
+                    popen_kwargs["pipesize"] = _PIPE_SIZE
+                self.p = await asyncio.create_subprocess_exec(*self.cmd, **popen_kwargs)
                 start_time = time.time()
                 self.msg_callback("Transition started")
-                for line in self.p.stdout:
-                    self.msg_callback(line.decode("utf-8").strip("\n"))
-
-                # We explicitly close stdout
-                self.p.stdout.close()
-
-                # Wait for process to complete
-                self.p.wait()
+                # Wait for process to complete, reading both pipes concurrently
+                self.std_out, self.std_err = await self.p.communicate()
+                for line in self.std_out.decode("utf-8", "replace").splitlines():
+                    self.msg_callback(line)
 
                 # Communicate callbacks
                 if self.cancelled:
@@ -219,37 +254,59 @@ class TransitionThread(Thread):
                                 time.time() - start_time
                             )
                         )
+                        std_err = self.std_err.decode("utf-8", "replace")
+                        for line in std_err.splitlines():
+                            self.msg_callback(line)
+                        # The transitioned file is the input of the next transition
+                        idfnew = trans.idfname.stripext() + ".idfnew"
+                        if not idfnew.exists():
+                            self.idf.as_version = last_successful_transition
+                            self.exception = EnergyPlusProcessError(
+                                cmd="IDF.upgrade",
+                                stderr="An error occurred during transitioning",
+                                idf=self.idf,
+                            )
+                            break
+                        os.replace(idfnew, trans.idfname)
                         last_successful_transition = trans.trans
-                        self.success_callback()
-                        for line in self.p.stderr:
-                            self.msg_callback(line.decode("utf-8"))
                     else:
                         # set the version of the IDF the latest it was able to transition
                         # to.
                         self.idf.as_version = last_successful_transition
                         self.msg_callback("Transition failed")
                         self.failure_callback()
+                        break
+
+        if last_successful_transition != initial_version:
+            await loop.run_in_executor(None, self.success_callback)
+
+    def _stage_files(self, generator):
+        """Copy the idf and idd files and link the transition programs in tmp.
+
+        The idd file is copied before the transition programs are linked, so that
+        the copy never writes through a link to an IDFVersionUpdater file.
+        """
+        self.idfname = generator.idfname
+        self.idd = self.idf.iddname.copy(self.tmp).expand()
+        generator.trans_exec  # populates the running directory
 
     @property
     def trans_exec(self) -> dict:
         """Return dict of {EnergyPlusVersion, executable} for each transitions."""
-        return {
-            EnergyPlusVersion(
-                re.search(r"to-V(([\d])-([\d])-([\d]))", exec).group(1)
-            ): exec
-            for exec in self.idf.idfversionupdater_dir.files("Transition-V*")
-        }
+        return _by_version(self._scan(str(self.idf.idfversionupdater_dir)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _scan(dir_path: str) -> tuple:
+        """Scan dir_path for transition programs, once per directory."""
+        return tuple(Path(dir_path).files("Transition-V*"))
 
     @property
     def transitions(self):
         """Return a sorted list of necessary transitions."""
-        transitions = [
-            key
-            for key in self.trans_exec
-            if self.idf.as_version >= key > self.idf.file_version
-        ]
-        transitions.sort()
-        return transitions
+        return _select_transitions(
+            list(self.trans_exec), self.idf.file_version, self.idf.as_version
+        )
 
     def msg_callback(self, *args, **kwargs):
         """Pass message to logger."""
@@ -259,33 +316,32 @@ class TransitionThread(Thread):
         """Retrieve the transitioned file.
 
         If self.overwrite is True, the transitioned file replaces the
-        original file.
+        original file. It is moved, not copied, unless the original file is on
+        another file system.
         """
-        for f in Path(self.run_dir).files("*.idfnew"):
-            if isinstance(self.idf.idfname, StringIO) or not self.overwrite:
-                file = StringIO(f.read_text())
-            else:
-                file = f.copy(self.idf.idfname)
-
-            # replace idfname with file
+        f = Path(self.idfname)
+        if isinstance(self.idf.idfname, StringIO) or not self.overwrite:
+            file = StringIO(f.read_text())
+        else:
+            file = Path(self.idf.idfname)
             try:
-                self.idf.idfname = file
-            except (NameError, UnboundLocalError):
-                self.exception = EnergyPlusProcessError(
-                    cmd="IDF.upgrade",
-                    stderr="An error occurred during transitioning",
-                    idf=self.idf,
-                )
-            else:
-                self.idf._reset_dependant_vars("idfname")
-                self.idf.iddname = None  # make sure iddname is reset as well
+                os.replace(f, file)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                f.copy(file)
+
+        # replace idfname with file
+        self.idf.idfname = file
+        self.idf._reset_dependant_vars("idfname")
+        self.idf.iddname = None  # make sure iddname is reset as well
 
     def failure_callback(self):
         """Read stderr and pass to logger."""
-        for line in self.p.stderr:
-            self.msg_callback(line.decode("utf-8"), level=lg.ERROR)
+        for line in self.std_err.decode("utf-8", "replace").splitlines():
+            self.msg_callback(line, level=lg.ERROR)
         self.exception = CalledProcessError(
-            self.p.returncode, cmd=self.cmd, stderr=self.p.stderr
+            self.p.returncode, self.cmd, stderr=self.std_err
         )
 
     def cancelled_callback(self, stdin, stdout):
@@ -295,6 +351,8 @@ class TransitionThread(Thread):
     @property
     def eplus_home(self):
         """Return the location of the EnergyPlus directory."""
+        from eppy.runner.run_functions import paths_from_version
+
         eplus_exe, eplus_home = paths_from_version(self.idf.as_version.dash)
         if not Path(eplus_home).exists():
             self.exception = EnergyPlusVersionError(
@@ -303,3 +361,286 @@ class TransitionThread(Thread):
             )
         else:
             return Path(eplus_home)
+
+
+def _by_version(executables) -> dict:
+    """Return {EnergyPlusVersion: executable} for executables, sorted by version.
+
+    A new EnergyPlusVersion is created for each executable on every call, so that
+    callers never share (mutable) version objects.
+    """
+    return {
+        EnergyPlusVersion(version): exec
+        for version, exec in sorted(
+            (_target_version(exec), exec) for exec in executables
+        )
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _target_version(executable) -> tuple:
+    """Return the target version of a transition program, eg.: (9, 2, 0)."""
+    return tuple(map(int, _TRANS_RE.search(executable).group(1).split("-")))
+
+
+def _select_transitions(versions, file_version, as_version) -> list:
+    """Return the versions in (file_version, as_version].
+
+    Args:
+        versions (list): Sorted list of the available transitions.
+        file_version (EnergyPlusVersion): The version to transition from.
+        as_version (EnergyPlusVersion): The version to transition to.
+    """
+    lo = bisect.bisect_right(versions, file_version)
+    hi = bisect.bisect_right(versions, as_version)
+    return versions[lo:hi]
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_which(path):
+    """Return shutil.which(path), resolved once per path."""
+    return shutil.which(path)
+
+
+def _populate(src, dst) -> list:
+    """Populate dst with the transition programs of src and return dst's programs.
+
+    A directory that already holds all the programs (eg.: reused between
+    upgrades) is left as is. The sentinel alone is not trusted: the directory may
+    have been partly cleaned.
+    """
+    dst = Path(dst)
+    ready = dst / _READY_SENTINEL
+    expected = {f.basename() for f in Path(src).files("Transition-V*")}
+    existing = dst.files("Transition-V*")
+    if not ready.exists() or not expected <= {f.basename() for f in existing}:
+        _link_tree(src, dst)
+        ready.touch()
+        existing = dst.files("Transition-V*")
+    return existing
+
+
+def _link_tree(src, dst):
+    """Populate dst with links to the files of src, recursively.
+
+    The transition programs and idd files, which a run only reads, are
+    hard-linked, which moves no data. Where hard links are not possible (eg.:
+    across devices), a symbolic link is created instead and, as a last resort,
+    the file is copied. Any other file is copied, so that a run writing to it
+    cannot modify the EnergyPlus installation. Entries already in dst are left as
+    is.
+
+    An entry that transiently disappears (eg.: locked by an antivirus scan) is
+    retried a few times with exponential backoff before it is skipped.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            d = os.path.join(dst, entry.name)
+            for attempt in range(_RETRIES):
+                try:
+                    if entry.is_dir():
+                        _link_tree(entry.path, d)
+                    elif _is_read_only(entry.name):
+                        _link_file(entry.path, d)
+                    elif not os.path.lexists(d):
+                        _copy_file(entry.path, d)
+                    break
+                except FileNotFoundError as e:
+                    if attempt == _RETRIES - 1:
+                        log(f"{e}")
+                    else:
+                        log(f"{e}. Retrying...", lg.DEBUG)
+                        time.sleep(0.1 * 4**attempt)
+
+
+def _is_read_only(name):
+    """Return True if the file name is a transition program or an idd file."""
+    return name.startswith("Transition-V") or name.lower().endswith(".idd")
+
+
+def _link_file(src, dst):
+    """Hard-link src to dst, falling back to a symlink, then to a copy."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        return
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            raise
+        # eg.: EXDEV (cross-device) or EPERM (links not supported).
+        try:
+            os.symlink(src, dst)
+        except OSError:
+            _copy_file(src, dst)
+
+
+def _copy_file(src, dst):
+    """Copy src to dst.
+
+    Large files (eg.: transition programs, idd files) are copied with
+    :func:`shutil.copyfile`, which uses the in-kernel fast path of the platform
+    (eg.: `sendfile` on Linux), and only their permission bits are copied.
+    Timestamps do not matter in a running directory.
+    """
+    if os.path.getsize(src) > _LARGE_FILE:
+        shutil.copyfile(src, dst)
+        shutil.copymode(src, dst)  # keep the programs executable
+    else:
+        shutil.copy2(src, dst)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the executor shared by all transitions, creating it if needed.
+
+    Transitions are run in worker processes, so that their Python-side work does
+    not contend for the GIL of the calling process. The workers are spawned, not
+    forked, which is safe from a multithreaded process; they start with the
+    logging and version settings of the calling process. The pool is shut down
+    when the interpreter exits.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=functools.partial(
+                    config,
+                    logs_folder=settings.logs_folder,
+                    log_file=settings.log_file,
+                    log_console=settings.log_console,
+                    log_level=settings.log_level,
+                    log_name=settings.log_name,
+                    log_filename=settings.log_filename,
+                    ep_version=settings.ep_version,
+                    debug=settings.debug,
+                ),
+            )
+            atexit.register(_EXECUTOR.shutdown)
+    return _EXECUTOR
+
+
+def _discard_executor(executor):
+    """Forget executor if it is the shared one, eg.: after a worker crashed."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is executor:
+            _EXECUTOR = None
+
+
+class _TransitionState:
+    """Picklable stand-in for the attributes of an IDF used by a transition.
+
+    The model is saved in the running directory by the calling process, so that
+    only paths and versions are sent to the worker running the transition.
+    """
+
+    def __init__(self, idf, tmp):
+        self.name = idf.name
+        self.position = idf.position
+        self.file_version = idf.file_version
+        self.as_version = idf.as_version
+        self.idfversionupdater_dir = idf.idfversionupdater_dir
+        self.iddname = idf.iddname
+        self.output_directory = idf.output_directory
+        self.in_memory = isinstance(idf.idfname, StringIO)
+        self.idfname = None if self.in_memory else Path(idf.idfname)
+        self.transitioned = False  # Set by _reset_dependant_vars()
+        self._saved = Path(idf.savecopy(Path(tmp) / "in.idf")).expand()
+
+    def savecopy(self, filename):
+        """Copy the saved model to filename, unless it is already there."""
+        filename = Path(filename).expand()
+        if filename != self._saved:
+            self._saved.copy(filename)
+        return filename
+
+    def _reset_dependant_vars(self, name):
+        """Record that the transitioned model replaced idfname."""
+        self.transitioned = True
+
+
+def _transition_worker(state, tmp, overwrite=False) -> dict:
+    """Run the transition programs on state and return the outcome as a dict.
+
+    The dict holds the exception raised, if any, the version reached and either
+    the path (`idfname`) or the content (`text`) of the transitioned model.
+
+    Args:
+        state (_TransitionState): The model to transition.
+        tmp (Path): The directory in which the transition programs are run.
+        overwrite (bool): If True, the transitioned file replaces the original file.
+    """
+    overwrite = overwrite and not state.in_memory
+    transition = TransitionThread(state, tmp, overwrite=overwrite)
+    transition.run()
+    result = dict(
+        exception=transition.exception,
+        as_version=state.as_version,
+        idfname=None,
+        text=None,
+    )
+    if state.transitioned:
+        if isinstance(state.idfname, StringIO):
+            result["text"] = state.idfname.getvalue()
+        else:
+            result["idfname"] = state.idfname
+    return result
+
+
+def _apply_result(idf, result) -> Optional[Exception]:
+    """Update idf with the outcome of :func:`_transition_worker`.
+
+    Returns:
+        Exception: The exception raised during the transition or None.
+    """
+    idf.as_version = result["as_version"]
+    exception = result["exception"]
+    if isinstance(exception, EnergyPlusProcessError):
+        exception.idf = idf
+    if result["text"] is not None:
+        idf.idfname = StringIO(result["text"])
+    elif result["idfname"] is not None:
+        idf.idfname = result["idfname"]
+    else:
+        return exception
+    idf._reset_dependant_vars("idfname")
+    idf.iddname = None  # make sure iddname is reset as well
+    return exception
+
+
+def submit_transition(idf, tmp, overwrite=False, executor=None) -> Future:
+    """Schedule the transition of idf and return its :class:`Future`.
+
+    Transitions are run on a pool of at most `os.cpu_count()` worker processes
+    shared by all calls, which bounds the number of transition programs running
+    at once. Only the paths and versions of idf are sent to the workers. The
+    result of the Future is the exception raised during the transition or None;
+    idf is updated before the result is set.
+
+    Since the workers are spawned, scripts must guard their entry point with
+    ``if __name__ == "__main__":``.
+
+    Args:
+        idf (IDF): The IDF model to transition.
+        tmp (Path): The directory in which the transition programs are run.
+        overwrite (bool): If True, the transitioned file replaces the original file.
+        executor (Executor, optional): The executor to submit to. Defaults to the
+            shared transition pool.
+    """
+    if executor is None:
+        executor = _get_executor()
+    state = _TransitionState(idf, tmp)
+    future = Future()
+
+    def _done(worker):
+        try:
+            future.set_result(_apply_result(idf, worker.result()))
+        except BaseException as e:
+            if isinstance(e, BrokenProcessPool):
+                _discard_executor(executor)
+            future.set_exception(e)
+
+    executor.submit(_transition_worker, state, tmp, overwrite).add_done_callback(_done)
+    return future
@@ -1,69 +1,113 @@
+import logging as lg
 from sqlite3 import connect
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
 from energy_pandas import EnergyDataFrame
 from energy_pandas.units import unit_registry
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 
 from archetypal.idfclass.sql import Sql
+from archetypal.utils import log
+
+# Metadata read from IDF models, keyed by model. Entries are dropped with their model.
+_IDF_METADATA = WeakKeyDictionary()
 
 
 class EndUseBalance:
-    HVAC_MODE = ("Zone Predicted Sensible Load to Setpoint Heat Transfer Rate",)
-    HVAC_INPUT_SENSIBLE = (  # not multiplied by zone or group multipliers
-        "Zone Air Heat Balance System Air Transfer Rate",
-        "Zone Air Heat Balance System Convective Heat Gain Rate",
+    HVAC_MODE = frozenset(
+        {"Zone Predicted Sensible Load to Setpoint Heat Transfer Rate"}
+    )
+    HVAC_INPUT_SENSIBLE = frozenset(
+        {  # not multiplied by zone or group multipliers
+            "Zone Air Heat Balance System Air Transfer Rate",
+            "Zone Air Heat Balance System Convective Heat Gain Rate",
+        }
+    )
+    HVAC_INPUT_HEATED_SURFACE = frozenset(
+        {
+            "Zone Radiant HVAC Heating Energy",
+            "Zone Ventilated Slab Radiant Heating Energy",
+        }
+    )
+    HVAC_INPUT_COOLED_SURFACE = frozenset(
+        {
+            "Zone Radiant HVAC Cooling Energy",
+            "Zone Ventilated Slab Radiant Cooling Energy",
+        }
     )
-    HVAC_INPUT_HEATED_SURFACE = (
-        "Zone Radiant HVAC Heating Energy",
-        "Zone Ventilated Slab Radiant Heating Energy",
+    LIGHTING = frozenset({"Zone Lights Total Heating Energy"})  # checked
+    EQUIP_GAINS = frozenset(
+        {  # checked
+            "Zone Electric Equipment Radiant Heating Energy",
+            "Zone Gas Equipment Radiant Heating Energy",
+            "Zone Steam Equipment Radiant Heating Energy",
+            "Zone Hot Water Equipment Radiant Heating Energy",
+            "Zone Other Equipment Radiant Heating Energy",
+            "Zone Electric Equipment Convective Heating Energy",
+            "Zone Gas Equipment Convective Heating Energy",
+            "Zone Steam Equipment Convective Heating Energy",
+            "Zone Hot Water Equipment Convective Heating Energy",
+            "Zone Other Equipment Convective Heating Energy",
+        }
     )
-    HVAC_INPUT_COOLED_SURFACE = (
-        "Zone Radiant HVAC Cooling Energy",
-        "Zone Ventilated Slab Radiant Cooling Energy",
+    PEOPLE_GAIN = frozenset({"Zone People Total Heating Energy"})  # checked
+    SOLAR_GAIN = frozenset(
+        {"Zone Windows Total Transmitted Solar Radiation Energy"}  # checked
     )
-    LIGHTING = ("Zone Lights Total Heating Energy",)  # checked
-    EQUIP_GAINS = (  # checked
-        "Zone Electric Equipment Radiant Heating Energy",
-        "Zone Gas Equipment Radiant Heating Energy",
-        "Zone Steam Equipment Radiant Heating Energy",
-        "Zone Hot Water Equipment Radiant Heating Energy",
-        "Zone Other Equipment Radiant Heating Energy",
-        "Zone Electric Equipment Convective Heating Energy",
-        "Zone Gas Equipment Convective Heating Energy",
-        "Zone Steam Equipment Convective Heating Energy",
-        "Zone Hot Water Equipment Convective Heating Energy",
-        "Zone Other Equipment Convective Heating Energy",
+    INFIL_GAIN = frozenset(
+        {
+            "Zone Infiltration Total Heat Gain Energy",  # checked
+            "AFN Zone Infiltration Total Heat Gain Energy",
+        }
     )
-    PEOPLE_GAIN = ("Zone People Total Heating Energy",)  # checked
-    SOLAR_GAIN = ("Zone Windows Total Transmitted Solar Radiation Energy",)  # checked
-    INFIL_GAIN = (
-        "Zone Infiltration Total Heat Gain Energy",  # checked
-        "AFN Zone Infiltration Total Heat Gain Energy",
+    INFIL_LOSS = frozenset(
+        {
+            "Zone Infiltration Total Heat Loss Energy",  # checked
+            "AFN Zone Infiltration Total Heat Loss Energy",
+        }
     )
-    INFIL_LOSS = (
-        "Zone Infiltration Total Heat Loss Energy",  # checked
-        "AFN Zone Infiltration Total Heat Loss Energy",
+    VENTILATION_LOSS = frozenset({"Zone Air System Total Heating Energy"})
+    VENTILATION_GAIN = frozenset({"Zone Air System Total Cooling Energy"})
+    NAT_VENT_GAIN = frozenset(
+        {
+            "Zone Ventilation Total Heat Gain Energy",
+            "AFN Zone Ventilation Total Heat Gain Energy",
+        }
     )
-    VENTILATION_LOSS = ("Zone Air System Total Heating Energy",)
-    VENTILATION_GAIN = ("Zone Air System Total Cooling Energy",)
-    NAT_VENT_GAIN = (
-        "Zone Ventilation Total Heat Gain Energy",
-        "AFN Zone Ventilation Total Heat Gain Energy",
+    NAT_VENT_LOSS = frozenset(
+        {
+            "Zone Ventilation Total Heat Loss Energy",
+            "AFN Zone Ventilation Total Heat Loss Energy",
+        }
     )
-    NAT_VENT_LOSS = (
-        "Zone Ventilation Total Heat Loss Energy",
-        "AFN Zone Ventilation Total Heat Loss Energy",
+    OPAQUE_ENERGY_FLOW = frozenset(
+        {"Surface Outside Face Conduction Heat Transfer Energy"}
     )
-    OPAQUE_ENERGY_FLOW = ("Surface Outside Face Conduction Heat Transfer Energy",)
-    OPAQUE_ENERGY_STORAGE = ("Surface Heat Storage Energy",)
-    WINDOW_LOSS = ("Zone Windows Total Heat Loss Energy",)  # checked
-    WINDOW_GAIN = ("Zone Windows Total Heat Gain Energy",)  # checked
-    HRV_LOSS = ("Heat Exchanger Total Cooling Energy",)
-    HRV_GAIN = ("Heat Exchanger Total Heating Energy",)
-    AIR_SYSTEM = (
-        "Air System Heating Coil Total Heating Energy",
-        "Air System Cooling Coil Total Cooling Energy",
+    OPAQUE_ENERGY_STORAGE = frozenset({"Surface Heat Storage Energy"})
+    WINDOW_LOSS = frozenset({"Zone Windows Total Heat Loss Energy"})  # checked
+    WINDOW_GAIN = frozenset({"Zone Windows Total Heat Gain Energy"})  # checked
+    HRV_LOSS = frozenset({"Heat Exchanger Total Cooling Energy"})
+    HRV_GAIN = frozenset({"Heat Exchanger Total Heating Energy"})
+    AIR_SYSTEM = frozenset(
+        {
+            "Air System Heating Coil Total Heating Energy",
+            "Air System Cooling Coil Total Cooling Energy",
+        }
+    )
+    # Components summarized by zone in `to_df`.
+    SUMMARY_COMPONENTS = (
+        "cooling",
+        "heating",
+        "lighting",
+        "electric_equip",
+        "people_gain",
+        "solar_gain",
+        "infiltration",
+        "window_energy_flow",
+        "nat_vent",
     )
 
     def __init__(
@@ -111,36 +155,95 @@ class EndUseBalance:
         self.air_system = air_system
         self.units = units
         self.use_all_solar = use_all_solar
+        self._period_masks = {}
         self.is_cooling = is_cooling
         self.is_heating = is_heating
 
+    @property
+    def is_cooling(self):
+        """Get or set the mask of the cooling periods, by zone."""
+        return self._is_cooling
+
+    @is_cooling.setter
+    def is_cooling(self, value):
+        self._is_cooling = value
+        self._period_masks.clear()  # computed from the cooling and heating masks
+
+    @property
+    def is_heating(self):
+        """Get or set the mask of the heating periods, by zone."""
+        return self._is_heating
+
+    @is_heating.setter
+    def is_heating(self, value):
+        self._is_heating = value
+        self._period_masks.clear()  # computed from the cooling and heating masks
+
     @classmethod
     def from_sql_file(
-        cls, sql_file, units="kWh", power_units="kW", outdoor_surfaces_only=True
+        cls,
+        sql_file,
+        units="kWh",
+        power_units="kW",
+        outdoor_surfaces_only=True,
+        dtype="float64",
     ):
         sql = Sql(sql_file)
 
-        _hvac_input = sql.timeseries_by_name(cls.HVAC_INPUT_SENSIBLE).to_units(
+        # Query all the outputs at once, then split them by component.
+        outputs = sql.timeseries_by_name(
+            cls.HVAC_MODE
+            | cls.HVAC_INPUT_SENSIBLE
+            | cls.HVAC_INPUT_HEATED_SURFACE
+            | cls.HVAC_INPUT_COOLED_SURFACE
+            | cls.LIGHTING
+            | cls.EQUIP_GAINS
+            | cls.PEOPLE_GAIN
+            | cls.SOLAR_GAIN
+            | cls.INFIL_GAIN
+            | cls.INFIL_LOSS
+            | cls.VENTILATION_LOSS
+            | cls.VENTILATION_GAIN
+            | cls.NAT_VENT_GAIN
+            | cls.NAT_VENT_LOSS
+            | cls.OPAQUE_ENERGY_FLOW
+            | cls.OPAQUE_ENERGY_STORAGE
+            | cls.WINDOW_LOSS
+            | cls.WINDOW_GAIN
+            | cls.HRV_LOSS
+            | cls.HRV_GAIN
+            | cls.AIR_SYSTEM
+        )
+        # Narrowing the values (eg.: to float32) halves the memory moved through the
+        # balance arithmetic below, at the cost of precision.
+        outputs = outputs.astype(dtype, copy=False)
+
+        _hvac_input = cls.select_outputs(outputs, cls.HVAC_INPUT_SENSIBLE).to_units(
             power_units
         )
-        _hvac_input_heated_surface = sql.timeseries_by_name(
-            cls.HVAC_INPUT_HEATED_SURFACE
+        _hvac_input_heated_surface = cls.select_outputs(
+            outputs, cls.HVAC_INPUT_HEATED_SURFACE
         ).to_units(units)
-        _hvac_input_cooled_surface = sql.timeseries_by_name(
-            cls.HVAC_INPUT_COOLED_SURFACE
+        _hvac_input_cooled_surface = cls.select_outputs(
+            outputs, cls.HVAC_INPUT_COOLED_SURFACE
         ).to_units(units)
-        # convert power to energy assuming the reporting frequency
-        freq = pd.infer_freq(_hvac_input.index)
-        assert freq == "H", "A reporting frequency other than H is not yet supported."
-        freq_to_unit = {"H": "hr"}
-        _hvac_input = _hvac_input.apply(
-            lambda row: unit_registry.Quantity(
-                row.values,
-                unit_registry(power_units) * unit_registry(freq_to_unit[freq]),
+        # convert power to energy using the reporting interval; the index of Sql
+        # timeseries already carries its frequency.
+        freq = getattr(_hvac_input.index, "freq", None) or to_offset(
+            pd.infer_freq(_hvac_input.index)
+        )
+        assert isinstance(
+            freq, Tick
+        ), f"A reporting frequency of {freq} is not yet supported."
+        factor = (
+            unit_registry.Quantity(
+                pd.Timedelta(freq).total_seconds(),
+                unit_registry(power_units) * unit_registry("s"),
             )
             .to(units)
             .m
         )
+        _hvac_input = _hvac_input * factor
 
         _hvac_input = pd.concat(
             filter(
@@ -153,19 +256,22 @@ class EndUseBalance:
                 ],
             ),
             axis=1,
-            verify_integrity=True,
+            copy=False,
         )
-        mode = sql.timeseries_by_name(cls.HVAC_MODE)  # positive = Heating
-        rolling_sign = cls.get_rolling_sign_change(mode).fillna(0)
+        mode = cls.select_outputs(outputs, cls.HVAC_MODE)  # positive = Heating
+        rolling_sign = cls.get_rolling_sign_change(mode).to_numpy()
 
-        # Create both heating and cooling masks
-        is_heating = rolling_sign.droplevel(["IndexGroup", "Name"], axis=1) == 1
-        is_cooling = rolling_sign.droplevel(["IndexGroup", "Name"], axis=1) == -1
+        # Create both heating and cooling masks, by zone, from the bare array
+        zones = mode.columns.droplevel(["IndexGroup", "Name"])
+        is_heating = EnergyDataFrame(rolling_sign == 1, index=mode.index, columns=zones)
+        is_cooling = EnergyDataFrame(
+            rolling_sign == -1, index=mode.index, columns=zones
+        )
 
         heating = _hvac_input.mul(is_heating, level="KeyValue", axis=1)
         cooling = _hvac_input.mul(is_cooling, level="KeyValue", axis=1)
 
-        lighting = sql.timeseries_by_name(cls.LIGHTING).to_units(units)
+        lighting = cls.select_outputs(outputs, cls.LIGHTING).to_units(units)
         zone_multipliers = sql.zone_info.set_index("ZoneName")["Multiplier"].rename(
             "KeyValue"
         )
@@ -173,28 +279,28 @@ class EndUseBalance:
             lighting,
             zone_multipliers,
         )
-        people_gain = sql.timeseries_by_name(cls.PEOPLE_GAIN).to_units(units)
+        people_gain = cls.select_outputs(outputs, cls.PEOPLE_GAIN).to_units(units)
         people_gain = cls.apply_multipliers(people_gain, zone_multipliers)
-        equipment = sql.timeseries_by_name(cls.EQUIP_GAINS).to_units(units)
+        equipment = cls.select_outputs(outputs, cls.EQUIP_GAINS).to_units(units)
         equipment = cls.apply_multipliers(equipment, zone_multipliers)
-        solar_gain = sql.timeseries_by_name(cls.SOLAR_GAIN).to_units(units)
+        solar_gain = cls.select_outputs(outputs, cls.SOLAR_GAIN).to_units(units)
         solar_gain = cls.apply_multipliers(solar_gain, zone_multipliers)
-        infil_gain = sql.timeseries_by_name(cls.INFIL_GAIN).to_units(units)
+        infil_gain = cls.select_outputs(outputs, cls.INFIL_GAIN).to_units(units)
         infil_gain = cls.apply_multipliers(infil_gain, zone_multipliers)
-        infil_loss = sql.timeseries_by_name(cls.INFIL_LOSS).to_units(units)
+        infil_loss = cls.select_outputs(outputs, cls.INFIL_LOSS).to_units(units)
         infil_loss = cls.apply_multipliers(infil_loss, zone_multipliers)
-        vent_loss = sql.timeseries_by_name(cls.VENTILATION_LOSS).to_units(units)
+        vent_loss = cls.select_outputs(outputs, cls.VENTILATION_LOSS).to_units(units)
         vent_loss = cls.apply_multipliers(vent_loss, zone_multipliers)
-        vent_gain = sql.timeseries_by_name(cls.VENTILATION_GAIN).to_units(units)
+        vent_gain = cls.select_outputs(outputs, cls.VENTILATION_GAIN).to_units(units)
         vent_gain = cls.apply_multipliers(vent_gain, zone_multipliers)
-        nat_vent_gain = sql.timeseries_by_name(cls.NAT_VENT_GAIN).to_units(units)
+        nat_vent_gain = cls.select_outputs(outputs, cls.NAT_VENT_GAIN).to_units(units)
         nat_vent_gain = cls.apply_multipliers(nat_vent_gain, zone_multipliers)
-        nat_vent_loss = sql.timeseries_by_name(cls.NAT_VENT_LOSS).to_units(units)
+        nat_vent_loss = cls.select_outputs(outputs, cls.NAT_VENT_LOSS).to_units(units)
         nat_vent_loss = cls.apply_multipliers(nat_vent_loss, zone_multipliers)
-        hrv_loss = sql.timeseries_by_name(cls.HRV_LOSS).to_units(units)
-        hrv_gain = sql.timeseries_by_name(cls.HRV_GAIN).to_units(units)
+        hrv_loss = cls.select_outputs(outputs, cls.HRV_LOSS).to_units(units)
+        hrv_gain = cls.select_outputs(outputs, cls.HRV_GAIN).to_units(units)
         hrv = cls.subtract_loss_from_gain(hrv_gain, hrv_loss, level="KeyValue")
-        air_system = sql.timeseries_by_name(cls.AIR_SYSTEM).to_units(units)
+        air_system = cls.select_outputs(outputs, cls.AIR_SYSTEM).to_units(units)
 
         # subtract losses from gains
         infiltration = None
@@ -210,22 +316,21 @@ class EndUseBalance:
             )
 
         # get the surface energy flow
-        opaque_flow = sql.timeseries_by_name(cls.OPAQUE_ENERGY_FLOW).to_units(units)
-        opaque_storage = sql.timeseries_by_name(cls.OPAQUE_ENERGY_STORAGE).to_units(
+        opaque_flow = cls.select_outputs(outputs, cls.OPAQUE_ENERGY_FLOW).to_units(
             units
         )
+        opaque_storage = cls.select_outputs(
+            outputs, cls.OPAQUE_ENERGY_STORAGE
+        ).to_units(units)
         opaque_storage_ = opaque_storage.copy()
         opaque_storage_.columns = opaque_flow.columns
         opaque_flow = -(opaque_flow + opaque_storage_)
-        window_loss = sql.timeseries_by_name(cls.WINDOW_LOSS).to_units(units)
+        window_loss = cls.select_outputs(outputs, cls.WINDOW_LOSS).to_units(units)
         window_loss = cls.apply_multipliers(window_loss, zone_multipliers)
-        window_gain = sql.timeseries_by_name(cls.WINDOW_GAIN).to_units(units)
+        window_gain = cls.select_outputs(outputs, cls.WINDOW_GAIN).to_units(units)
         window_gain = cls.apply_multipliers(window_gain, zone_multipliers)
-        window_flow = cls.subtract_loss_from_gain(
-            window_gain, window_loss, level="Name"
-        )
-        window_flow = cls.subtract_solar_from_window_net(
-            window_flow, solar_gain, level="KeyValue"
+        window_flow = cls.subtract_loss_and_solar_from_window_gain(
+            window_gain, window_loss, solar_gain, level="KeyValue"
         )
 
         opaque_flow = cls.match_opaque_surface_to_zone(
@@ -275,29 +380,49 @@ class EndUseBalance:
         )
         return bal_obj
 
+    @classmethod
+    def select_outputs(cls, outputs, names):
+        """Return the columns of `outputs` whose output name is one of `names`.
+
+        Like :meth:`Sql.timeseries_by_name`, an empty EnergyDataFrame is returned
+        if none of the names are found.
+        """
+        if outputs.empty:
+            return outputs
+        selected = outputs.loc[:, outputs.columns.get_level_values("Name").isin(names)]
+        if selected.empty:
+            return EnergyDataFrame([])
+        return selected
+
     @classmethod
     def apply_multipliers(cls, data, idf):
         from archetypal import IDF
 
         if isinstance(idf, IDF):
-            multipliers = (
-                pd.Series(
-                    {
-                        zone.Name.upper(): zone.Multiplier
-                        for zone in idf.idfobjects["ZONE"]
-                    },
-                    name="Key_Name",
-                )
-                .replace({"": 1})
-                .fillna(1)
-            )
+            multipliers = _idf_metadata(idf, _zone_multipliers)
             key = "OutputVariable"
         elif isinstance(idf, pd.Series):
             multipliers = idf
             key = "KeyValue"
         else:
             raise ValueError
-        return data.mul(multipliers, level=key, axis=1)
+        if key not in data.columns.names:  # eg.: output not found
+            return data.mul(multipliers, level=key, axis=1)
+        # One factor per column, broadcast over the rows; keys without a
+        # multiplier are left as is.
+        values = data.to_numpy()
+        factors = (
+            multipliers.reindex(data.columns.get_level_values(key))
+            .fillna(1)
+            .to_numpy(dtype=values.dtype)
+        )
+        result = EnergyDataFrame(
+            values * factors,
+            index=data.index,
+            columns=data.columns,
+        )
+        result.units = dict(data.units)
+        return result
 
     @classmethod
     def subtract_cooled_from_heated_surface(
@@ -313,8 +438,8 @@ class EndUseBalance:
             columns = None
         return EnergyDataFrame(
             (
-                _hvac_input_heated_surface.sum(level="KeyValue", axis=1)
-                - _hvac_input_cooled_surface.sum(level="KeyValue", axis=1)
+                _sum_columns(_hvac_input_heated_surface, "KeyValue")
+                - _sum_columns(_hvac_input_cooled_surface, "KeyValue")
             ).values,
             columns=columns,
             index=_hvac_input_heated_surface.index,
@@ -322,20 +447,19 @@ class EndUseBalance:
 
     @classmethod
     def get_rolling_sign_change(cls, data: pd.DataFrame):
-        # create a sign series where -1 is negative and 0 or 1 is positive
-        sign = (
-            np.sign(data)
-            .replace({0: np.NaN})
-            .fillna(method="bfill")
-            .fillna(method="ffill")
-        )
-        # when does a change of sign occurs?
-        sign_switch = sign != sign.shift(-1)
-        # From sign, keep when the sign switches and fill with the previous values
-        # (back fill). The final forward fill is to fill the last few timesteps of the
-        # series which might be NaNs.
-        rolling_sign = sign[sign_switch].fillna(method="bfill").fillna(method="ffill")
-        return rolling_sign
+        """Return the sign (-1 or 1) of each column of `data` at each timestep.
+
+        Timesteps where the value is 0 (or NaN) take the sign of the next non-zero
+        value (back fill). The last few timesteps of a column, which have no next
+        non-zero value, take the sign of the previous one (forward fill). Columns
+        that are 0 throughout are NaN.
+        """
+        # Keeping the sign only where it switches and back filling it gives the
+        # sign itself, so the fills are done once, on the bare array.
+        sign = np.sign(data.to_numpy(dtype=np.float64))
+        sign[sign == 0] = np.NaN
+        rolling_sign = pd.DataFrame(sign).bfill().ffill().to_numpy()
+        return EnergyDataFrame(rolling_sign, index=data.index, columns=data.columns)
 
     @classmethod
     def match_window_to_zone(cls, idf, window_flow):
@@ -345,51 +469,38 @@ class EndUseBalance:
             * Building_Surface_Name
             * Surface_Type
             * Zone_Name
-            * Multiplier
+
+        and multiplies each window by its multiplier.
         """
         # Todo: Check if Zone Multiplier needs to be added.
         assert window_flow.columns.names == ["OutputVariable", "Key_Name"]
-        window_to_surface_match = pd.DataFrame(
+        window_to_surface_match = _idf_metadata(idf, _window_surfaces)
+        # Match the subsurface to the surface name and the zone name it belongs to.
+        key_names = window_flow.columns.get_level_values("Key_Name")
+        meta = window_to_surface_match.rename(index=str.upper).reindex(
+            key_names.str.upper()
+        )
+        columns = pd.MultiIndex.from_arrays(
             [
-                (
-                    window.Name.upper(),  # name of the window
-                    window.Building_Surface_Name.upper(),  # name of the wall this window is on
-                    window.get_referenced_object(
-                        "Building_Surface_Name"
-                    ).Surface_Type.title(),  # surface type (wall, ceiling, floor) this windows is on.
-                    window.get_referenced_object(  # get the zone name though the surface name
-                        "Building_Surface_Name"
-                    ).Zone_Name.upper(),
-                    float(window.Multiplier)
-                    if window.Multiplier != ""
-                    else 1,  # multiplier of this window.
-                )
-                for window in idf.getsubsurfaces()
+                window_flow.columns.get_level_values("OutputVariable"),
+                key_names,
+                meta["Building_Surface_Name"].values,
+                meta["Surface_Type"].values,
+                meta["Zone_Name"].values,
             ],
-            columns=[
-                "Name",
+            names=[
+                "OutputVariable",
+                "Key_Name",
                 "Building_Surface_Name",
                 "Surface_Type",
                 "Zone_Name",
-                "Multiplier",
             ],
-        ).set_index("Name")
-        # Match the subsurface to the surface name and the zone name it belongs to.
-        stacked = (
-            window_flow.stack()
-            .join(
-                window_to_surface_match.rename(index=str.upper),
-                on="Key_Name",
-            )
-            .set_index(
-                ["Building_Surface_Name", "Surface_Type", "Zone_Name"], append=True
-            )
         )
-        window_flow = (
-            stacked.drop(columns=["Multiplier"]).iloc[:, 0] * stacked["Multiplier"]
-        )
-        window_flow = window_flow.unstack(
-            level=["Key_Name", "Building_Surface_Name", "Surface_Type", "Zone_Name"]
+        values = window_flow.to_numpy()
+        window_flow = EnergyDataFrame(
+            values * meta["Multiplier"].to_numpy(dtype=values.dtype),
+            index=window_flow.index,
+            columns=columns,
         )
 
         return window_flow  # .groupby("Building_Surface_Name", axis=1).sum()
@@ -431,6 +542,17 @@ class EndUseBalance:
 
     @classmethod
     def subtract_loss_from_gain(cls, load_gain, load_loss, level="OutputVariable"):
+        # eg.: outputs not found; nothing to subtract from or to subtract
+        if load_loss.empty:
+            if load_gain.empty:
+                return load_gain
+            return load_gain.rename(
+                columns=lambda x: str.replace(x, " Gain", ""), level=level
+            )
+        if load_gain.empty:
+            return -load_loss.rename(
+                columns=lambda x: str.replace(x, " Loss", ""), level=level
+            )
         try:
             columns = load_gain.rename(
                 columns=lambda x: str.replace(x, " Gain", ""), level=level
@@ -445,24 +567,68 @@ class EndUseBalance:
 
     @classmethod
     def subtract_solar_from_window_net(cls, window_flow, solar_gain, level="Key_Name"):
+        if window_flow.empty and solar_gain.empty:
+            return window_flow
         columns = window_flow.columns
         return EnergyDataFrame(
-            window_flow.sum(level=level, axis=1).values
-            - solar_gain.sum(level=level, axis=1).values,
+            _sum_columns(window_flow, level).values
+            - _sum_columns(solar_gain, level).values,
             columns=columns,
             index=window_flow.index,
         )
 
+    @classmethod
+    def subtract_loss_and_solar_from_window_gain(
+        cls, window_gain, window_loss, solar_gain, level="Key_Name"
+    ):
+        """Return the net window heat flow without the transmitted solar gain.
+
+        Same as :meth:`subtract_loss_from_gain` followed by
+        :meth:`subtract_solar_from_window_net`, but each input is summed by `level`
+        once and the differences are taken in a single pass.
+        """
+        if window_gain.empty and window_loss.empty and solar_gain.empty:
+            return window_gain
+        try:
+            columns = window_gain.rename(
+                columns=lambda x: str.replace(x, " Gain", ""), level="Name"
+            ).columns
+        except KeyError:
+            columns = None
+        return EnergyDataFrame(
+            _sum_columns(window_gain, level).values
+            - _sum_columns(window_loss, level).values
+            - _sum_columns(solar_gain, level).values,
+            columns=columns,
+            index=window_gain.index,
+        )
+
     @classmethod
     def subtract_vent_from_system(cls, system, vent, level="Key_Name"):
+        if system.empty and vent.empty:
+            return system
         columns = vent.columns
         return EnergyDataFrame(
-            system.sum(level=level, axis=1).values
-            - vent.sum(level=level, axis=1).values,
+            _sum_columns(system, level).values - _sum_columns(vent, level).values,
             columns=columns,
             index=system.index,
         )
 
+    def _masks_by_period(self, level):
+        """Return the (period, mask) pairs, with the mask columns named `level`.
+
+        The masks are computed once per level and reused by every component.
+        """
+        if level not in self._period_masks:
+            self._period_masks[level] = [
+                (period, pd.DataFrame(is_period).rename_axis(level, axis=1))
+                for period, is_period in (
+                    ("Cooling Periods", self.is_cooling),
+                    ("Heating Periods", self.is_heating),
+                )
+            ]
+        return self._period_masks[level]
+
     def separate_gains_and_losses(self, component, level="Key_Name") -> EnergyDataFrame:
         """Separate gains from losses when cooling and heating occurs for the component.
 
@@ -478,32 +644,26 @@ class EndUseBalance:
         ), f"{component} is not a valid attribute of EndUseBalance."
         component_df = getattr(self, component)
         assert not component_df.empty, "Expected a component that is not empty."
-        print(component)
+        log(f"Separating gains and losses of {component}", lg.DEBUG)
 
-        c_df = getattr(self, component)
-
-        # concatenate the Periods
-        inter = pd.concat(
-            [
-                c_df.mul(self.is_cooling.rename_axis(level, axis=1), level=level),
-                c_df.mul(self.is_heating.rename_axis(level, axis=1), level=level),
-            ],
-            keys=["Cooling Periods", "Heating Periods"],
-            names=["Period"],
+        # For each Period, split the values in gains (positive) and losses, side by
+        # side, instead of stacking the Periods and unstacking them afterwards. The
+        # split is done on plain DataFrames so that the units are only set once,
+        # on the result.
+        c_df = pd.DataFrame(component_df)
+        blocks = {}
+        for period, is_period in self._masks_by_period(level):
+            inter = c_df.mul(is_period, level=level)
+            positive_mask = inter >= 0
+            blocks[(period, "Heat Gain")] = inter.where(positive_mask)
+            blocks[(period, "Heat Loss")] = inter.where(~positive_mask)
+        final = EnergyDataFrame(
+            pd.concat(blocks, axis=1, names=["Period", "Gain/Loss"], copy=False)
         )
 
-        # mask when values are positive (gain)
-        positive_mask = inter >= 0
-
-        # concatenate the Gain/Loss
-        final = pd.concat(
-            [
-                inter[positive_mask].reindex(inter.index),
-                inter[~positive_mask].reindex(inter.index),
-            ],
-            keys=["Heat Gain", "Heat Loss"],
-            names=["Gain/Loss"],
-        ).unstack(["Period", "Gain/Loss"])
+        # move the Period and Gain/Loss levels last
+        order = list(range(2, final.columns.nlevels)) + [0, 1]
+        final = final.reorder_levels(order, axis=1)
         final.sort_index(axis=1, inplace=True)
         return final
 
@@ -512,115 +672,88 @@ class EndUseBalance:
         if separate_gains_and_losses:
             summary_by_component = {}
             levels = ["Component", "Zone_Name", "Period", "Gain/Loss"]
-            for component in [
-                "cooling",
-                "heating",
-                "lighting",
-                "electric_equip",
-                "people_gain",
-                "solar_gain",
-                "infiltration",
-                "window_energy_flow",
-                "nat_vent",
-            ]:
+            for component in self.SUMMARY_COMPONENTS:
                 if not getattr(self, component).empty:
-                    summary_by_component[component] = (
-                        self.separate_gains_and_losses(
-                            component,
-                            level=level,
-                        )
-                        .groupby(level=["KeyValue", "Period", "Gain/Loss"], axis=1)
-                        .sum()
-                        .sort_index(axis=1)
-                    )
+                    summary_by_component[component] = _sum_columns(
+                        self.separate_gains_and_losses(component, level=level),
+                        ["KeyValue", "Period", "Gain/Loss"],
+                    ).sort_index(axis=1)
             for (surface_type), data in self.separate_gains_and_losses(
                 "opaque_flow", level="Zone_Name"
             ).groupby(level=["Surface_Type"], axis=1):
-                summary_by_component[surface_type] = data.sum(
-                    level=["Zone_Name", "Period", "Gain/Loss"], axis=1
+                summary_by_component[surface_type] = _sum_columns(
+                    data, ["Zone_Name", "Period", "Gain/Loss"]
                 ).sort_index(axis=1)
 
         else:
             summary_by_component = {}
-            for component in [
-                "cooling",
-                "heating",
-                "lighting",
-                "electric_equip",
-                "people_gain",
-                "solar_gain",
-                "infiltration",
-                "window_energy_flow",
-                "nat_vent",
-            ]:
+            for component in self.SUMMARY_COMPONENTS:
                 component_df = getattr(self, component)
                 if not component_df.empty:
-                    summary_by_component[component] = component_df.sum(
-                        level=level, axis=1
+                    summary_by_component[component] = _sum_columns(
+                        component_df, level
                     ).sort_index(axis=1)
             for (zone_name, surface_type), data in self.opaque_flow.groupby(
                 level=["Zone_Name", "Surface_Type"], axis=1
             ):
-                summary_by_component[surface_type] = data.sum(
-                    level="Zone_Name", axis=1
+                summary_by_component[surface_type] = _sum_columns(
+                    data, "Zone_Name"
                 ).sort_index(axis=1)
             levels = ["Component", "Zone_Name"]
 
         # Add contribution of heating/cooling outside air, if any
         if not self.air_system.empty:
-            summary_by_component["air_system_heating"] = (
+            summary_by_component["air_system_heating"] = _add_column_levels(
                 self.air_system.xs(
                     "Air System Heating Coil Total Heating Energy", level="Name", axis=1
-                )
-                .assign(**{"Period": "Heating Periods", "Gain/Loss": "Heat Loss"})
-                .set_index(["Period", "Gain/Loss"], append=True)
-                .unstack(["Period", "Gain/Loss"])
-                .droplevel("IndexGroup", axis=1)
+                ).droplevel("IndexGroup", axis=1),
+                **{"Period": "Heating Periods", "Gain/Loss": "Heat Loss"},
             )
-            summary_by_component["air_system_cooling"] = (
+            summary_by_component["air_system_cooling"] = _add_column_levels(
                 self.air_system.xs(
                     "Air System Cooling Coil Total Cooling Energy", level="Name", axis=1
-                )
-                .assign(**{"Period": "Cooling Periods", "Gain/Loss": "Heat Gain"})
-                .set_index(["Period", "Gain/Loss"], append=True)
-                .unstack(["Period", "Gain/Loss"])
-                .droplevel("IndexGroup", axis=1)
+                ).droplevel("IndexGroup", axis=1),
+                **{"Period": "Cooling Periods", "Gain/Loss": "Heat Gain"},
             )
-        return pd.concat(
-            summary_by_component, axis=1, verify_integrity=True, names=levels
-        )
+        return pd.concat(summary_by_component, axis=1, names=levels, copy=False)
 
     def component_summary(self) -> EnergyDataFrame:
         """Return a DataFrame of components summarized annually."""
         sum_opaque_flow = (
             self.separate_gains_and_losses("opaque_flow", "Zone_Name")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
         sum_window_flow = (
             self.separate_gains_and_losses("window_flow", "Zone_Name")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
         sum_solar_gain = (
             self.separate_gains_and_losses("solar_gain")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
         sum_lighting = (
             self.separate_gains_and_losses("lighting")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
         sum_infiltration = (
             self.separate_gains_and_losses("infiltration")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
         sum_people_gain = (
             self.separate_gains_and_losses("people_gain")
             .sum()
-            .sum(level=["Period", "Gain/Loss"])
+            .groupby(level=["Period", "Gain/Loss"], sort=False)
+            .sum()
         )
 
         df = pd.concat(
@@ -640,14 +773,18 @@ class EndUseBalance:
                 "Infiltration",
                 "Occupants (Sensible + Latent)",
             ],
+            copy=False,
         )
 
         return df.unstack(level=["Period", "Gain/Loss"])
 
     def to_sankey(self, path_or_buf):
         system_data = self.to_df(separate_gains_and_losses=True)
-        annual_system_data = system_data.sum().sum(
-            level=["Component", "Period", "Gain/Loss"]
+        annual_system_data = (
+            system_data.sum()
+            .groupby(level=["Component", "Period", "Gain/Loss"], sort=False)
+            .sum()
+            .unstack("Gain/Loss")
         )
         annual_system_data.rename(
             {
@@ -721,30 +858,31 @@ class EndUseBalance:
         )
 
         system_input = (
-            system_input.replace({0: np.NaN})
+            system_input.mask(lambda x: x == 0)
             .dropna(how="all")
             .dropna(how="all", axis=1)
         )
         system_input.rename_axis("source", axis=1, inplace=True)
         system_input.rename_axis("target", axis=0, inplace=True)
         system_input = system_input.unstack().rename("value").reset_index().dropna()
-        system_input_data = system_input.to_dict(orient="records")
 
-        heating_energy_to_heating_system = [
+        heating_energy_to_heating_system = pd.DataFrame(
             {
                 "source": "Heating",
                 "target": "Heating System",
                 "value": system_input.set_index("target").at["Heating", "value"].sum(),
-            }
-        ]
+            },
+            index=[0],
+        )
 
-        cooling_energy_to_heating_system = [
+        cooling_energy_to_heating_system = pd.DataFrame(
             {
                 "source": "Cooling",
                 "target": "Cooling System",
                 "value": system_input.set_index("target").at["Cooling", "value"].sum(),
-            }
-        ]
+            },
+            index=[0],
+        )
 
         (
             heating_load_source_data,
@@ -758,14 +896,17 @@ class EndUseBalance:
             link_cooling_system_to_gains,
         ) = self._sankey_cooling(cooling_load, load_type="cooling")
 
-        flows = pd.DataFrame(
-            system_input_data
-            + heating_energy_to_heating_system
-            + heating_load_source_data
-            + heating_load_target_data
-            + cooling_energy_to_heating_system
-            + cooling_load_source_data
-            + cooling_load_target_data
+        flows = pd.concat(
+            [
+                system_input,
+                heating_energy_to_heating_system,
+                heating_load_source_data,
+                heating_load_target_data,
+                cooling_energy_to_heating_system,
+                cooling_load_source_data,
+                cooling_load_target_data,
+            ],
+            ignore_index=True,
         )
         # Fix the HVAC difference
         diff = (
@@ -789,101 +930,160 @@ class EndUseBalance:
 
         # TO EUI
         flows["value"] = flows["value"] / floor_area
-        links = pd.DataFrame(
-            link_heating_system_to_gains + link_cooling_system_to_gains
+        links = pd.concat(
+            [link_heating_system_to_gains, link_cooling_system_to_gains],
+            ignore_index=True,
         )
         return pd.concat([flows, links]).to_csv(path_or_buf, index=False)
 
     def _sankey_heating(self, load, load_type="heating"):
         assert load_type in ["heating", "cooling"]
-        load_source = (
-            load.unstack("Gain/Loss")
-            .replace({0: np.NaN})
-            .loc[:, "Heat Gain"]
-            .dropna(how="all")
-            .apply(abs)
-            .rename("value")
-            .reset_index()
-        )
-        load_target = (
-            load.unstack("Gain/Loss")
-            .replace({0: np.NaN})
-            .loc[:, "Heat Loss"]
-            .dropna(how="all")
-            .apply(abs)
-            .rename("value")
-            .reset_index()
-        )
-        load_source["target"] = load_type.title() + " Load"
-        load_source = load_source.rename({"Component": "source"}, axis=1)
-        load_source["source"] = load_source["source"] + " Gain"
-        load_source = load_source.replace(
-            {f"{load_type} Gain": load_type.title() + " System"}
-        )
-
-        load_source_data = load_source.to_dict(orient="records")
-        load_target["source"] = load_type.title() + " Load"
-        load_target = load_target.rename({"Component": "target"}, axis=1)
-        load_target["target"] = load_target["target"] + " Heat Losses"
-        load_target_data = load_target.to_dict(orient="records")
-        link_system_to_gains = (
-            load_source.set_index("source")
-            .drop(load_type.title() + " System", errors="ignore")
-            .rename_axis("target")
-            .apply(lambda x: 0.01, axis=1)
-            .rename("value")
-            .reset_index()
-        )
-        link_system_to_gains["source"] = load_type.title()
-        link_system_to_gains = link_system_to_gains.to_dict(orient="records")
+        gain_labels, gains = _nonzero_magnitudes(load, "Heat Gain")
+        loss_labels, losses = _nonzero_magnitudes(load, "Heat Loss")
+        system = load_type.title() + " System"
+        sources = gain_labels + " Gain"
+        sources = sources.where(sources != f"{load_type} Gain", system)
+        load_source = pd.DataFrame(
+            {
+                "source": sources,
+                "value": gains,
+                "target": load_type.title() + " Load",
+            }
+        )
+        load_target = pd.DataFrame(
+            {
+                "target": loss_labels + " Heat Losses",
+                "value": losses,
+                "source": load_type.title() + " Load",
+            }
+        )
+        # link the system to each of the other sources with a small constant value
+        link_system_to_gains = pd.DataFrame(
+            {
+                "target": sources[sources != system],
+                "value": 0.01,
+                "source": load_type.title(),
+            }
+        )
         return (
-            load_source_data,
-            load_target_data,
+            load_source,
+            load_target,
             link_system_to_gains,
         )
 
     def _sankey_cooling(self, load, load_type="cooling"):
-        load_source = (
-            load.unstack("Gain/Loss")
-            .replace({0: np.NaN})
-            .loc[:, "Heat Loss"]
-            .dropna(how="all")
-            .apply(abs)
-            .rename("value")
-            .reset_index()
-        )
-        load_source["target"] = load_type.title() + " Load"
-        load_source = load_source.rename({"Component": "source"}, axis=1)
-        load_source["source"] = load_source["source"] + " Losses"
-        load_source = load_source.replace(
-            {f"{load_type} Losses": load_type.title() + " System"}
-        )
-        load_source_data = load_source.to_dict(orient="records")
-
-        load_target = (
-            load.unstack("Gain/Loss")
-            .replace({0: np.NaN})
-            .loc[:, "Heat Gain"]
-            .dropna(how="all")
-            .apply(abs)
-            .rename("value")
-            .reset_index()
-        )
-        load_target["source"] = load_type.title() + " Load"
-        load_target = load_target.rename({"Component": "target"}, axis=1)
-        load_target_data = load_target.to_dict(orient="records")
-        link_system_to_gains = (
-            load_source.set_index("source")
-            .drop(load_type.title() + " System", errors="ignore")
-            .rename_axis("target")
-            .apply(lambda x: 0.01, axis=1)
-            .rename("value")
-            .reset_index()
-        )
-        link_system_to_gains["source"] = load_type.title()
-        link_system_to_gains = link_system_to_gains.to_dict(orient="records")
+        loss_labels, losses = _nonzero_magnitudes(load, "Heat Loss")
+        gain_labels, gains = _nonzero_magnitudes(load, "Heat Gain")
+        system = load_type.title() + " System"
+        sources = loss_labels + " Losses"
+        sources = sources.where(sources != f"{load_type} Losses", system)
+        load_source = pd.DataFrame(
+            {
+                "source": sources,
+                "value": losses,
+                "target": load_type.title() + " Load",
+            }
+        )
+        load_target = pd.DataFrame(
+            {
+                "target": gain_labels,
+                "value": gains,
+                "source": load_type.title() + " Load",
+            }
+        )
+        # link the system to each of the other sources with a small constant value
+        link_system_to_gains = pd.DataFrame(
+            {
+                "target": sources[sources != system],
+                "value": 0.01,
+                "source": load_type.title(),
+            }
+        )
         return (
-            load_source_data,
-            load_target_data,
+            load_source,
+            load_target,
             link_system_to_gains,
         )
+
+
+def _nonzero_magnitudes(data, column):
+    """Get the labels and absolute values of the non-zero values in `column`.
+
+    Zeros and missing values are dropped in the same pass.
+    """
+    values = data[column].to_numpy()
+    keep = (values != 0) & ~np.isnan(values)
+    return data.index[keep], np.abs(values[keep])
+
+
+def _sum_columns(data, level) -> EnergyDataFrame:
+    """Sum the columns of `data` that share the same values of `level`.
+
+    Same as `data.groupby(level=level, axis=1, sort=False).sum()`, but the
+    columns are grouped on a plain DataFrame: grouping the columns of an
+    EnergyDataFrame transposes it, and each transpose rebuilds the units of every
+    timestep.
+    """
+    return EnergyDataFrame(
+        pd.DataFrame(data).groupby(level=level, axis=1, sort=False).sum()
+    )
+
+
+def _add_column_levels(data, **levels) -> EnergyDataFrame:
+    """Return `data` with constant column levels appended, eg. Period="Heating Periods".
+
+    Labels the columns directly, instead of moving the labels to the rows and
+    unstacking them.
+    """
+    columns = data.columns.to_frame(index=False).assign(**levels)
+    return data.set_axis(pd.MultiIndex.from_frame(columns), axis=1)
+
+
+def _idf_metadata(idf, extract):
+    """Return extract(idf), computed once per model until its objects are re-read."""
+    token = id(idf.idfobjects)
+    cache = _IDF_METADATA.setdefault(idf, {})
+    if extract not in cache or cache[extract][0] != token:
+        cache[extract] = (token, extract(idf))
+    return cache[extract][1]
+
+
+def _zone_multipliers(idf) -> pd.Series:
+    """Return the multiplier of each zone of idf, indexed by upper-case zone name."""
+    return (
+        pd.Series(
+            {zone.Name.upper(): zone.Multiplier for zone in idf.idfobjects["ZONE"]},
+            name="Key_Name",
+        )
+        .replace({"": 1})
+        .fillna(1)
+    )
+
+
+def _window_surfaces(idf) -> pd.DataFrame:
+    """Return the surface, surface type, zone and multiplier of each window of idf."""
+    return pd.DataFrame(
+        [
+            (
+                window.Name.upper(),  # name of the window
+                window.Building_Surface_Name.upper(),  # name of the wall this window is on
+                window.get_referenced_object(
+                    "Building_Surface_Name"
+                ).Surface_Type.title(),  # surface type (wall, ceiling, floor) this windows is on.
+                window.get_referenced_object(  # get the zone name though the surface name
+                    "Building_Surface_Name"
+                ).Zone_Name.upper(),
+                float(window.Multiplier)
+                if window.Multiplier != ""
+                else 1,  # multiplier of this window.
+            )
+            for window in idf.getsubsurfaces()
+        ],
+        columns=[
+            "Name",
+            "Building_Surface_Name",
+            "Surface_Type",
+            "Zone_Name",
+            "Multiplier",
+        ],
+    ).set_index("Name")
@@ -51,7 +51,7 @@ from archetypal.eplus_interface.exceptions import (
 )
 from archetypal.eplus_interface.expand_objects import ExpandObjectsThread
 from archetypal.eplus_interface.slab import SlabThread
-from archetypal.eplus_interface.transition import TransitionThread
+from archetypal.eplus_interface.transition import submit_transition
 from archetypal.eplus_interface.version import EnergyPlusVersion
 from archetypal.idfclass.meters import Meters
 from archetypal.idfclass.outputs import Outputs
@@ -1685,13 +1685,10 @@ class IDF(GeomIDF):
             tmp = (
                 self.output_directory / "Transition_run_" + str(uuid.uuid1())[0:8]
             ).makedirs_p()
-            transition_thread = TransitionThread(self, tmp, overwrite=overwrite)
-            transition_thread.start()
-            transition_thread.join()
-            while transition_thread.is_alive():
-                time.sleep(1)
-            tmp.rmtree(ignore_errors=True)
-            e = transition_thread.exception
+            try:
+                e = submit_transition(self, tmp, overwrite=overwrite).result()
+            finally:
+                tmp.rmtree(ignore_errors=True)
             if e is not None:
                 raise e
 
@@ -2145,7 +2142,6 @@ class IDF(GeomIDF):
             (dict of eppy.bunch_subclass.EpBunch): the schedules with their
                 name as a key
         """
-        schedule_types = list(map(str.upper, self.getiddgroupdict()["Schedules"]))
         if yearly_only:
             schedule_types = [
                 "Schedule:Year".upper(),
@@ -2153,15 +2149,13 @@ class IDF(GeomIDF):
                 "Schedule:Constant".upper(),
                 "Schedule:File".upper(),
             ]
-        scheds = {}
-        for sched_type in schedule_types:
-            for sched in self.idfobjects[sched_type]:
-                try:
-                    if sched.key.upper() in schedule_types:
-                        scheds[sched.Name.upper()] = sched
-                except KeyError:
-                    pass
-        return scheds
+        else:
+            schedule_types = map(str.upper, self.getiddgroupdict()["Schedules"])
+        return {
+            sched.Name.upper(): sched
+            for sched_type in schedule_types
+            for sched in self.idfobjects[sched_type]
+        }
 
     def _get_used_schedules(self, yearly_only=False):
         """Return all used schedules.
@@ -1,8 +1,18 @@
+from itertools import chain
 from typing import Iterable
 
 from archetypal.idfclass.end_use_balance import EndUseBalance
 from archetypal.idfclass.extensions import get_name_attribute
 
+OUTPUT_VARIABLE = "OUTPUT:VARIABLE"
+OUTPUT_METER = "OUTPUT:METER"
+OUTPUT_SQLITE = "OUTPUT:SQLITE"
+OUTPUT_CONTROL_TABLE_STYLE = "OUTPUTCONTROL:TABLE:STYLE"
+OUTPUT_TABLE_SUMMARY_REPORTS = "OUTPUT:TABLE:SUMMARYREPORTS"
+OUTPUT_SCHEDULES = "OUTPUT:SCHEDULES"
+OUTPUT_VARIABLE_DICTIONARY = "OUTPUT:VARIABLEDICTIONARY"
+OUTPUT_SURFACES_DRAWING = "OUTPUT:SURFACES:DRAWING"
+
 
 class Outputs:
     """Handles preparation of EnergyPlus outputs. Different instance methods
@@ -17,6 +27,21 @@ class Outputs:
     """
 
     REPORTING_FREQUENCIES = ("Annual", "Monthly", "Daily", "Hourly", "Timestep")
+    _REPORTING_FREQUENCIES = frozenset(REPORTING_FREQUENCIES)
+    UNIT_CONVERSIONS = frozenset({"None", "JtoKWH", "JtoMJ", "JtoGJ", "InchPound"})
+    TABLE_STYLES = frozenset(
+        {
+            "Comma",
+            "Tab",
+            "Fixed",
+            "HTML",
+            "XML",
+            "CommaAndHTML",
+            "TabAndHTML",
+            "XMLAndHTML",
+            "All",
+        }
+    )
     COOLING = (
         "Zone Ideal Loads Supply Air Total Cooling Energy",
         "Zone Ideal Loads Zone Sensible Cooling Energy",
@@ -96,6 +121,168 @@ class Outputs:
     OPAQUE_ENERGY_FLOW = ("Surface Average Face Conduction Heat Transfer Energy",)
     WINDOW_LOSS = ("Surface Window Heat Loss Energy",)
     WINDOW_GAIN = ("Surface Window Heat Gain Energy",)
+    LOAD_BALANCE = frozenset(
+        chain(
+            COOLING,
+            HEATING,
+            LIGHTING,
+            ELECTRIC_EQUIP,
+            GAS_EQUIP,
+            HOT_WATER,
+            PEOPLE_GAIN,
+            SOLAR_GAIN,
+            INFIL_GAIN,
+            INFIL_LOSS,
+            VENT_LOSS,
+            VENT_GAIN,
+            NAT_VENT_GAIN,
+            NAT_VENT_LOSS,
+            OPAQUE_ENERGY_FLOW,
+            WINDOW_LOSS,
+            WINDOW_GAIN,
+        )
+    )
+    END_USE_BALANCE = frozenset(
+        chain(
+            EndUseBalance.HVAC_MODE,
+            EndUseBalance.HVAC_INPUT_SENSIBLE,
+            EndUseBalance.HVAC_INPUT_HEATED_SURFACE,
+            EndUseBalance.HVAC_INPUT_COOLED_SURFACE,
+            EndUseBalance.LIGHTING,
+            EndUseBalance.EQUIP_GAINS,
+            EndUseBalance.PEOPLE_GAIN,
+            EndUseBalance.SOLAR_GAIN,
+            EndUseBalance.INFIL_GAIN,
+            EndUseBalance.INFIL_LOSS,
+            EndUseBalance.VENTILATION_LOSS,
+            EndUseBalance.VENTILATION_GAIN,
+            EndUseBalance.NAT_VENT_GAIN,
+            EndUseBalance.NAT_VENT_LOSS,
+            EndUseBalance.OPAQUE_ENERGY_FLOW,
+            EndUseBalance.OPAQUE_ENERGY_STORAGE,
+            EndUseBalance.WINDOW_LOSS,
+            EndUseBalance.WINDOW_GAIN,
+            EndUseBalance.HRV_LOSS,
+            EndUseBalance.HRV_GAIN,
+            EndUseBalance.AIR_SYSTEM,
+        )
+    )
+    SENSIBLE_HEAT_GAIN_SUMMARY = frozenset(
+        {
+            # HVAC Input Sensible Air Heating and Cooling
+            "Zone Air Heat Balance System Air Transfer Rate",
+            "Zone Air Heat Balance System Convective Heat Gain Rate",
+            # HVAC Input Heated Surface Heating
+            "Zone Radiant HVAC Heating Energy",
+            "Zone Ventilated Slab Radiant Heating Energy",
+            # HVAC Input Cooled Surface Cooling
+            "Zone Radiant HVAC Cooling Energy",
+            "Zone Ventilated Slab Radiant Cooling Energy",
+            # People Sensible Heat Addition
+            "Zone People Sensible Heating Energy",
+            # Lights Sensible Heat Addition
+            "Zone Lights Total Heating Energy",
+            # Equipment Sensible Heat Addition and Removal
+            "Zone Electric Equipment Radiant Heating Energy",
+            "Zone Gas Equipment Radiant Heating Energy",
+            "Zone Steam Equipment Radiant Heating Energy",
+            "Zone Hot Water Equipment Radiant Heating Energy",
+            "Zone Other Equipment Radiant Heating Energy",
+            "Zone Electric Equipment Convective Heating Energy",
+            "Zone Gas Equipment Convective Heating Energy",
+            "Zone Steam Equipment Convective Heating Energy",
+            "Zone Hot Water Equipment Convective Heating Energy",
+            "Zone Other Equipment Convective Heating Energy",
+            # Window Heat Addition and Removal
+            "Zone Windows Total Heat Gain Energy",
+            # Interzone Air Transfer Heat Addition and Removal
+            "Zone Air Heat Balance Interzone Air Transfer Rate",
+            # Infiltration Heat Addition and Removal
+            "Zone Air Heat Balance Outdoor Air Transfer Rate",
+        }
+    )
+    UMI_TEMPLATE_VARIABLES = frozenset(
+        {
+            "Air System Outdoor Air Minimum Flow Fraction",
+            "Air System Total Cooling Energy",
+            "Air System Total Heating Energy",
+            "Heat Exchanger Latent Effectiveness",
+            "Heat Exchanger Sensible Effectiveness",
+            "Heat Exchanger Total Heating Rate",
+            "Water Heater Heating Energy",
+            "Zone Ideal Loads Zone Total Cooling Energy",
+            "Zone Ideal Loads Zone Total Heating Energy",
+            "Zone Thermostat Cooling Setpoint Temperature",
+            "Zone Thermostat Heating Setpoint Temperature",
+        }
+    )
+    UMI_TEMPLATE_METERS = frozenset(
+        {
+            "Baseboard:EnergyTransfer",
+            "Cooling:DistrictCooling",
+            "Cooling:Electricity",
+            "Cooling:EnergyTransfer",
+            "Cooling:Gas",
+            "CoolingCoils:EnergyTransfer",
+            "Fans:Electricity",
+            "HeatRejection:Electricity",
+            "HeatRejection:EnergyTransfer",
+            "Heating:DistrictHeating",
+            "Heating:Electricity",
+            "Heating:EnergyTransfer",
+            "Heating:Gas",
+            "HeatingCoils:EnergyTransfer",
+            "Pumps:Electricity",
+            "Refrigeration:Electricity",
+            "Refrigeration:EnergyTransfer",
+            "WaterSystems:EnergyTransfer",
+        }
+    )
+    UMI = frozenset(
+        {
+            "Air System Total Heating Energy",
+            "Air System Total Cooling Energy",
+            "Zone Ideal Loads Zone Total Cooling Energy",
+            "Zone Ideal Loads Zone Total Heating Energy",
+            "Water Heater Heating Energy",
+        }
+    )
+    PROFILE_GAS_ELECT = frozenset(
+        {
+            "Electricity:Facility",
+            "Gas:Facility",
+            "WaterSystems:Electricity",
+            "Heating:Electricity",
+            "Cooling:Electricity",
+        }
+    )
+    HVAC_ENERGY_USE = frozenset(
+        {
+            "Baseboard Electricity Energy",
+            "Boiler NaturalGas Energy",
+            "Chiller Electricity Energy",
+            "Chiller Heater System Cooling Electricity Energy",
+            "Chiller Heater System Heating Electricity Energy",
+            "Cooling Coil Electricity Energy",
+            "Cooling Tower Fan Electricity Energy",
+            "District Cooling Chilled Water Energy",
+            "District Heating Hot Water Energy",
+            "Evaporative Cooler Electricity Energy",
+            "Fan Electricity Energy",
+            "Heating Coil Electricity Energy",
+            "Heating Coil NaturalGas Energy",
+            "Heating Coil Total Heating Energy",
+            "Hot_Water_Loop_Central_Air_Source_Heat_Pump Electricity Consumption",
+            "Humidifier Electricity Energy",
+            "Pump Electricity Energy",
+            "VRF Heat Pump Cooling Electricity Energy",
+            "VRF Heat Pump Crankcase Heater Electricity Energy",
+            "VRF Heat Pump Defrost Electricity Energy",
+            "VRF Heat Pump Heating Electricity Energy",
+            "Zone VRF Air Terminal Cooling Electricity Energy",
+            "Zone VRF Air Terminal Heating Electricity Energy",
+        }
+    )
 
     def __init__(
         self,
@@ -114,16 +301,15 @@ class Outputs:
             idf (IDF): the IDF object for wich this outputs object is created.
         """
         self.idf = idf
-        self.output_variables = set(
-            a.Variable_Name for a in idf.idfobjects["Output:Variable".upper()]
+        self.output_variables = chain(
+            (a.Variable_Name for a in idf.idfobjects[OUTPUT_VARIABLE]),
+            variables or (),
         )
-        self.output_meters = set(
-            get_name_attribute(a) for a in idf.idfobjects["Output:Meter".upper()]
+        self.output_meters = chain(
+            (get_name_attribute(a) for a in idf.idfobjects[OUTPUT_METER]),
+            meters or (),
         )
         self.other_outputs = outputs
-        self.output_variables += tuple(variables or ())
-        self.output_meters += tuple(meters or ())
-        self.other_outputs += tuple(outputs or ())
         self.reporting_frequency = reporting_frequency
         self.include_sqlite = include_sqlite
         self.include_html = include_html
@@ -137,8 +323,8 @@ class Outputs:
     def unit_conversion(self, value):
         if not value:
             value = "None"
-        assert value in ["None", "JtoKWH", "JtoMJ", "JtoGJ", "InchPound"]
-        for obj in self.idf.idfobjects["OutputControl:Table:Style".upper()]:
+        assert value in self.UNIT_CONVERSIONS
+        for obj in self.idf.idfobjects[OUTPUT_CONTROL_TABLE_STYLE]:
             obj.Unit_Conversion = value
         self._unit_conversion = value
 
@@ -154,7 +340,7 @@ class Outputs:
             self.add_sql().apply()
         else:
             # if False, try to remove sql, if exists.
-            for obj in self.idf.idfobjects["Output:SQLite".upper()]:
+            for obj in self.idf.idfobjects[OUTPUT_SQLITE]:
                 self.idf.removeidfobject(obj)
         self._include_sqlite = value
 
@@ -170,14 +356,16 @@ class Outputs:
             self.add_output_control().apply()
         else:
             # if False, try to remove sql, if exists.
-            for obj in self.idf.idfobjects["OutputControl:Table:Style".upper()]:
+            for obj in self.idf.idfobjects[OUTPUT_CONTROL_TABLE_STYLE]:
                 obj.Column_Separator = "Comma"
         self._include_html = value
 
     @property
     def output_variables(self) -> tuple:
         """Get or set a tuple of EnergyPlus simulation output variables."""
-        return tuple(sorted(self._output_variables))
+        if self._output_variables_sorted is None:
+            self._output_variables_sorted = tuple(sorted(self._output_variables))
+        return self._output_variables_sorted
 
     @output_variables.setter
     def output_variables(self, value):
@@ -185,18 +373,18 @@ class Outputs:
             assert not isinstance(
                 value, (str, bytes)
             ), f"Expected list or tuple. Got {type(value)}."
-            values = []
-            for output in value:
-                values.append(str(output))
-            value = set(values)
+            value = set(map(str, value))
         else:
             value = set()
         self._output_variables = value
+        self._output_variables_sorted = None  # sorted on first read
 
     @property
     def output_meters(self):
         """Get or set a tuple of EnergyPlus simulation output meters."""
-        return tuple(sorted(self._output_meters))
+        if self._output_meters_sorted is None:
+            self._output_meters_sorted = tuple(sorted(self._output_meters))
+        return self._output_meters_sorted
 
     @output_meters.setter
     def output_meters(self, value):
@@ -204,13 +392,21 @@ class Outputs:
             assert not isinstance(
                 value, (str, bytes)
             ), f"Expected list or tuple. Got {type(value)}."
-            values = []
-            for output in value:
-                values.append(str(output))
-            value = set(values)
+            value = set(map(str, value))
         else:
             value = set()
         self._output_meters = value
+        self._output_meters_sorted = None  # sorted on first read
+
+    def _add_output_variables(self, variables):
+        """Add variables to the output variables and reset their sorted tuple."""
+        self._output_variables.update(variables)
+        self._output_variables_sorted = None
+
+    def _add_output_meters(self, meters):
+        """Add meters to the output meters and reset their sorted tuple."""
+        self._output_meters.update(meters)
+        self._output_meters_sorted = None
 
     @property
     def other_outputs(self):
@@ -223,10 +419,7 @@ class Outputs:
             assert all(
                 isinstance(item, dict) for item in value
             ), f"Expected list of dict. Got {type(value)}."
-            values = []
-            for output in value:
-                values.append(output)
-            value = values
+            value = list(value)
         else:
             value = []
         self._other_outputs = value
@@ -248,7 +441,7 @@ class Outputs:
     @reporting_frequency.setter
     def reporting_frequency(self, value):
         value = value.title()
-        assert value in self.REPORTING_FREQUENCIES, (
+        assert value in self._REPORTING_FREQUENCIES, (
             f"reporting_frequency {value} is not recognized.\nChoose from the "
             f"following:\n{self.REPORTING_FREQUENCIES}"
         )
@@ -276,9 +469,9 @@ class Outputs:
         assert isinstance(outputs, Iterable), "outputs must be some sort of iterable"
         for output in outputs:
             if "meter" in output["key"].lower():
-                self._output_meters.add(output["Key_Name"])
+                self._add_output_meters((output["Key_Name"],))
             elif "variable" in output["key"].lower():
-                self._output_variables.add(output["Variable_Name"])
+                self._add_output_variables((output["Variable_Name"],))
             else:
                 self._other_outputs.append(output)
         return self
@@ -294,9 +487,8 @@ class Outputs:
 
     def add_schedules(self):
         """Adds Schedules object"""
-        outputs = [{"key": "Output:Schedules".upper(), **dict(Key_Field="Hourly")}]
-        for output in outputs:
-            self._other_outputs.append(output)
+        outputs = [{"key": OUTPUT_SCHEDULES, **dict(Key_Field="Hourly")}]
+        self._other_outputs.extend(outputs)
         return self
 
     def add_meter_variables(self, format="IDF"):
@@ -314,9 +506,8 @@ class Outputs:
         Returns:
             Outputs: self
         """
-        outputs = [dict(key="Output:VariableDictionary".upper(), Key_Field=format)]
-        for output in outputs:
-            self._other_outputs.append(output)
+        outputs = [dict(key=OUTPUT_VARIABLE_DICTIONARY, Key_Field=format)]
+        self._other_outputs.extend(outputs)
         return self
 
     def add_summary_report(self, summary="AllSummary"):
@@ -342,12 +533,11 @@ class Outputs:
         """
         outputs = [
             {
-                "key": "Output:Table:SummaryReports".upper(),
+                "key": OUTPUT_TABLE_SUMMARY_REPORTS,
                 **dict(Report_1_Name=summary),
             }
         ]
-        for output in outputs:
-            self._other_outputs.append(output)
+        self._other_outputs.extend(outputs)
         return self
 
     def add_sql(self, sql_output_style="SimpleAndTabular"):
@@ -366,12 +556,9 @@ class Outputs:
         Returns:
             Outputs: self
         """
-        outputs = [
-            {"key": "Output:SQLite".upper(), **dict(Option_Type=sql_output_style)}
-        ]
+        outputs = [{"key": OUTPUT_SQLITE, **dict(Option_Type=sql_output_style)}]
 
-        for output in outputs:
-            self._other_outputs.append(output)
+        self._other_outputs.extend(outputs)
         return self
 
     def add_output_control(self, output_control_table_style="CommaAndHTML"):
@@ -383,247 +570,62 @@ class Outputs:
         Returns:
             Outputs: self
         """
-        assert output_control_table_style in [
-            "Comma",
-            "Tab",
-            "Fixed",
-            "HTML",
-            "XML",
-            "CommaAndHTML",
-            "TabAndHTML",
-            "XMLAndHTML",
-            "All",
-        ]
+        assert output_control_table_style in self.TABLE_STYLES
         outputs = [
             {
-                "key": "OutputControl:Table:Style".upper(),
+                "key": OUTPUT_CONTROL_TABLE_STYLE,
                 **dict(Column_Separator=output_control_table_style),
             }
         ]
 
-        for output in outputs:
-            self._other_outputs.append(output)
+        self._other_outputs.extend(outputs)
         return self
 
     def add_umi_template_outputs(self):
         """Adds the necessary outputs in order to create an UMI template."""
-        # list the outputs here
-        variables = [
-            "Air System Outdoor Air Minimum Flow Fraction",
-            "Air System Total Cooling Energy",
-            "Air System Total Heating Energy",
-            "Heat Exchanger Latent Effectiveness",
-            "Heat Exchanger Sensible Effectiveness",
-            "Heat Exchanger Total Heating Rate",
-            "Water Heater Heating Energy",
-            "Zone Ideal Loads Zone Total Cooling Energy",
-            "Zone Ideal Loads Zone Total Heating Energy",
-            "Zone Thermostat Cooling Setpoint Temperature",
-            "Zone Thermostat Heating Setpoint Temperature",
-        ]
-        for output in variables:
-            self._output_variables.add(output)
-
-        meters = [
-            "Baseboard:EnergyTransfer",
-            "Cooling:DistrictCooling",
-            "Cooling:Electricity",
-            "Cooling:Electricity",
-            "Cooling:EnergyTransfer",
-            "Cooling:Gas",
-            "CoolingCoils:EnergyTransfer",
-            "Fans:Electricity",
-            "HeatRejection:Electricity",
-            "HeatRejection:EnergyTransfer",
-            "Heating:DistrictHeating",
-            "Heating:Electricity",
-            "Heating:EnergyTransfer",
-            "Heating:Gas",
-            "HeatingCoils:EnergyTransfer",
-            "Pumps:Electricity",
-            "Refrigeration:Electricity",
-            "Refrigeration:EnergyTransfer",
-            "WaterSystems:EnergyTransfer",
-        ]
-        for meter in meters:
-            self._output_meters.add(meter)
+        self._add_output_variables(self.UMI_TEMPLATE_VARIABLES)
+        self._add_output_meters(self.UMI_TEMPLATE_METERS)
         return self
 
     def add_dxf(self):
         outputs = [
             {
-                "key": "Output:Surfaces:Drawing".upper(),
+                "key": OUTPUT_SURFACES_DRAWING,
                 **dict(Report_Type="DXF", Report_Specifications_1="ThickPolyline"),
             }
         ]
-        for output in outputs:
-            self._other_outputs.append(output)
+        self._other_outputs.extend(outputs)
         return self
 
     def add_umi_outputs(self):
         """Adds the necessary outputs in order to return the same energy profile
         as in UMI.
         """
-        # list the outputs here
-        outputs = [
-            "Air System Total Heating Energy",
-            "Air System Total Cooling Energy",
-            "Zone Ideal Loads Zone Total Cooling Energy",
-            "Zone Ideal Loads Zone Total Heating Energy",
-            "Water Heater Heating Energy",
-        ]
-        for output in outputs:
-            self._output_variables.add(output)
+        self._add_output_variables(self.UMI)
         return self
 
     def add_sensible_heat_gain_summary_components(self):
-        hvac_input_sensible_air_heating = [
-            "Zone Air Heat Balance System Air Transfer Rate",
-            "Zone Air Heat Balance System Convective Heat Gain Rate",
-        ]
-        hvac_input_sensible_air_cooling = [
-            "Zone Air Heat Balance System Air Transfer Rate",
-            "Zone Air Heat Balance System Convective Heat Gain Rate",
-        ]
-
-        hvac_input_heated_surface_heating = [
-            "Zone Radiant HVAC Heating Energy",
-            "Zone Ventilated Slab Radiant Heating Energy",
-        ]
-
-        hvac_input_cooled_surface_cooling = [
-            "Zone Radiant HVAC Cooling Energy",
-            "Zone Ventilated Slab Radiant Cooling Energy",
-        ]
-        people_sensible_heat_addition = ["Zone People Sensible Heating Energy"]
-
-        lights_sensible_heat_addition = ["Zone Lights Total Heating Energy"]
-
-        equipment_sensible_heat_addition_and_equipment_sensible_heat_removal = [
-            "Zone Electric Equipment Radiant Heating Energy",
-            "Zone Gas Equipment Radiant Heating Energy",
-            "Zone Steam Equipment Radiant Heating Energy",
-            "Zone Hot Water Equipment Radiant Heating Energy",
-            "Zone Other Equipment Radiant Heating Energy",
-            "Zone Electric Equipment Convective Heating Energy",
-            "Zone Gas Equipment Convective Heating Energy",
-            "Zone Steam Equipment Convective Heating Energy",
-            "Zone Hot Water Equipment Convective Heating Energy",
-            "Zone Other Equipment Convective Heating Energy",
-        ]
-
-        window_heat_addition_and_window_heat_removal = [
-            "Zone Windows Total Heat Gain Energy"
-        ]
-
-        interzone_air_transfer_heat_addition_and_interzone_air_transfer_heat_removal = [
-            "Zone Air Heat Balance Interzone Air Transfer Rate"
-        ]
-
-        infiltration_heat_addition_and_infiltration_heat_removal = [
-            "Zone Air Heat Balance Outdoor Air Transfer Rate"
-        ]
-
-        tuple(map(self._output_variables.add, hvac_input_sensible_air_heating))
-        tuple(map(self._output_variables.add, hvac_input_sensible_air_cooling))
-        tuple(map(self._output_variables.add, hvac_input_heated_surface_heating))
-        tuple(map(self._output_variables.add, hvac_input_cooled_surface_cooling))
-        tuple(map(self._output_variables.add, people_sensible_heat_addition))
-        tuple(map(self._output_variables.add, lights_sensible_heat_addition))
-        tuple(
-            map(
-                self._output_variables.add,
-                equipment_sensible_heat_addition_and_equipment_sensible_heat_removal,
-            )
-        )
-        tuple(
-            map(
-                self._output_variables.add, window_heat_addition_and_window_heat_removal
-            )
-        )
-        tuple(
-            map(
-                self._output_variables.add,
-                interzone_air_transfer_heat_addition_and_interzone_air_transfer_heat_removal,
-            )
-        )
-        tuple(
-            map(
-                self._output_variables.add,
-                infiltration_heat_addition_and_infiltration_heat_removal,
-            )
-        )
-
-        # The Opaque Surface Conduction and Other Heat Addition and Opaque Surface Conduction and Other Heat Removal
-        # columns are also calculated on an timestep basis as the negative value of the other removal and gain columns
-        # so that the total for the timestep sums to zero. These columns are derived strictly from the other columns.
+        # The Opaque Surface Conduction and Other Heat Addition and Opaque Surface
+        # Conduction and Other Heat Removal columns are also calculated on an
+        # timestep basis as the negative value of the other removal and gain columns
+        # so that the total for the timestep sums to zero. These columns are derived
+        # strictly from the other columns.
+        self._add_output_variables(self.SENSIBLE_HEAT_GAIN_SUMMARY)
+        return self
 
     def add_end_use_balance_components(self):
-        for group in [
-            EndUseBalance.HVAC_MODE,
-            EndUseBalance.HVAC_INPUT_SENSIBLE,
-            EndUseBalance.HVAC_INPUT_HEATED_SURFACE,
-            EndUseBalance.HVAC_INPUT_COOLED_SURFACE,
-            EndUseBalance.LIGHTING,
-            EndUseBalance.EQUIP_GAINS,
-            EndUseBalance.PEOPLE_GAIN,
-            EndUseBalance.SOLAR_GAIN,
-            EndUseBalance.INFIL_GAIN,
-            EndUseBalance.INFIL_LOSS,
-            EndUseBalance.VENTILATION_LOSS,
-            EndUseBalance.VENTILATION_GAIN,
-            EndUseBalance.NAT_VENT_GAIN,
-            EndUseBalance.NAT_VENT_LOSS,
-            EndUseBalance.OPAQUE_ENERGY_FLOW,
-            EndUseBalance.OPAQUE_ENERGY_STORAGE,
-            EndUseBalance.WINDOW_LOSS,
-            EndUseBalance.WINDOW_GAIN,
-            EndUseBalance.HRV_LOSS,
-            EndUseBalance.HRV_GAIN,
-            EndUseBalance.AIR_SYSTEM,
-        ]:
-            for item in group:
-                self._output_variables.add(item)
+        self._add_output_variables(self.END_USE_BALANCE)
         return self
 
     def add_load_balance_components(self):
-
-        for group in [
-            self.COOLING,
-            self.HEATING,
-            self.LIGHTING,
-            self.ELECTRIC_EQUIP,
-            self.GAS_EQUIP,
-            self.HOT_WATER,
-            self.PEOPLE_GAIN,
-            self.SOLAR_GAIN,
-            self.INFIL_GAIN,
-            self.INFIL_LOSS,
-            self.VENT_LOSS,
-            self.VENT_GAIN,
-            self.NAT_VENT_GAIN,
-            self.NAT_VENT_LOSS,
-            self.OPAQUE_ENERGY_FLOW,
-            self.WINDOW_LOSS,
-            self.WINDOW_GAIN,
-        ]:
-            for item in group:
-                self._output_variables.add(item)
+        self._add_output_variables(self.LOAD_BALANCE)
+        return self
 
     def add_profile_gas_elect_outputs(self):
         """Adds the following meters: Electricity:Facility, Gas:Facility,
         WaterSystems:Electricity, Heating:Electricity, Cooling:Electricity
         """
-        # list the outputs here
-        outputs = [
-            "Electricity:Facility",
-            "Gas:Facility",
-            "WaterSystems:Electricity",
-            "Heating:Electricity",
-            "Cooling:Electricity",
-        ]
-        for output in outputs:
-            self._output_meters.add(output)
+        self._add_output_meters(self.PROFILE_GAS_ELECT)
         return self
 
     def add_hvac_energy_use(self):
@@ -633,56 +635,65 @@ class Outputs:
         which is meant to catch all energy-consuming parts of a system.
         (eg. chillers, boilers, coils, humidifiers, fans, pumps).
         """
-        outputs = [
-            "Baseboard Electricity Energy",
-            "Boiler NaturalGas Energy",
-            "Chiller Electricity Energy",
-            "Chiller Heater System Cooling Electricity Energy",
-            "Chiller Heater System Heating Electricity Energy",
-            "Cooling Coil Electricity Energy",
-            "Cooling Tower Fan Electricity Energy",
-            "District Cooling Chilled Water Energy",
-            "District Heating Hot Water Energy",
-            "Evaporative Cooler Electricity Energy",
-            "Fan Electricity Energy",
-            "Heating Coil Electricity Energy",
-            "Heating Coil NaturalGas Energy",
-            "Heating Coil Total Heating Energy",
-            "Hot_Water_Loop_Central_Air_Source_Heat_Pump Electricity Consumption",
-            "Humidifier Electricity Energy",
-            "Pump Electricity Energy",
-            "VRF Heat Pump Cooling Electricity Energy",
-            "VRF Heat Pump Crankcase Heater Electricity Energy",
-            "VRF Heat Pump Defrost Electricity Energy",
-            "VRF Heat Pump Heating Electricity Energy",
-            "Zone VRF Air Terminal Cooling Electricity Energy",
-            "Zone VRF Air Terminal Heating Electricity Energy",
-        ]
-        for output in outputs:
-            self._output_variables.add(output)
+        self._add_output_variables(self.HVAC_ENERGY_USE)
+        return self
 
     def apply(self):
         """Applies the outputs to the idf model. Modifies the model by calling
         :meth:`~archetypal.idfclass.idf.IDF.newidfobject`"""
-        for output in self.output_variables:
-            self.idf.newidfobject(
-                key="Output:Variable".upper(),
-                **dict(
-                    Variable_Name=output, Reporting_Frequency=self.reporting_frequency
-                ),
-            )
-        for meter in self.output_meters:
-            self.idf.newidfobject(
-                key="Output:Meter".upper(),
-                **dict(Key_Name=meter, Reporting_Frequency=self.reporting_frequency),
-            )
+        self._add_new_objects(
+            OUTPUT_VARIABLE,
+            (
+                dict(Variable_Name=output, Reporting_Frequency=self.reporting_frequency)
+                for output in self.output_variables
+            ),
+        )
+        self._add_new_objects(
+            OUTPUT_METER,
+            (
+                dict(Key_Name=meter, Reporting_Frequency=self.reporting_frequency)
+                for meter in self.output_meters
+            ),
+        )
         for output in self.other_outputs:
-            key = output.pop("key", None)
-            if key:
-                output["key"] = key.upper()
-            self.idf.newidfobject(**output)
+            self.idf.newidfobject(**{**output, "key": output["key"].upper()})
         return self
 
+    def _add_new_objects(self, key, fields):
+        """Add an object of type `key` to the model for each dict of `fields`.
+
+        Same as calling :meth:`~archetypal.idfclass.idf.IDF.newidfobject` for each
+        of them, for objects that have no Name and are not unique-objects: objects
+        equal to one already in the model are skipped. Instead of comparing each
+        new object to every existing one, the field values of the existing objects
+        are hashed once, and the new objects are added in one go.
+        """
+        # Two objects are equal if the field values of one start with the field
+        # values of the other (see EpBunch.__eq__).
+        values, starts = set(), set()
+
+        def index(obj_values):
+            values.add(obj_values)
+            starts.update(obj_values[:i] for i in range(1, len(obj_values) + 1))
+
+        def exists(obj_values):
+            return obj_values in starts or any(
+                obj_values[:i] in values for i in range(1, len(obj_values))
+            )
+
+        for obj in self.idf.idfobjects[key]:
+            index(tuple(str(value).upper() for value in obj.obj))
+
+        new_objects = []
+        for kwargs in fields:
+            new_object = self.idf.anidfobject(key, **kwargs)
+            obj_values = tuple(str(value).upper() for value in new_object.obj)
+            if not exists(obj_values):
+                index(obj_values)
+                new_objects.append(new_object)
+        if new_objects:
+            self.idf.addidfobjects(new_objects)
+
     def __repr__(self):
         variables = "OutputVariables:\n {}".format("\n ".join(self.output_variables))
         meters = "OutputMeters:\n {}".format("\n ".join(self.output_meters))
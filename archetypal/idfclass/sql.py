@@ -1,6 +1,5 @@
 """Module for parsing EnergyPlus SQLite result files into DataFrames."""
 import logging
-from datetime import timedelta
 from sqlite3 import connect
 from typing import List, Optional, Sequence, Union
 
@@ -303,7 +302,7 @@ class Sql:
                     query,
                     conn,
                     params={
-                        "output_name": variable_or_meter[0],
+                        "output_name": next(iter(variable_or_meter)),
                         "reporting_frequency": reporting_frequency,
                     },
                 )
@@ -487,7 +486,7 @@ def _extract_timeseries(
         }
     )
     # Adjust timeindex by timedelta
-    index -= data["Interval"].apply(lambda x: timedelta(minutes=x))
+    index -= pd.to_timedelta(data["Interval"], unit="min")
     index = pd.DatetimeIndex(index, freq="infer")
     # get data
     data = data.drop(columns=date_time_names, level="IndexGroup")
@@ -6,9 +6,11 @@ Notes:
     archetypal.template module.
 """
 
+import functools
 import math
 from typing import List, Union
 
+import numpy as np
 from validator_collection import validators
 
 from archetypal.template.materials import GasMaterial
@@ -17,6 +19,29 @@ from archetypal.template.materials.material_layer import MaterialLayer
 from archetypal.template.umi_base import UmiBase
 
 
+@functools.lru_cache(maxsize=None)
+def _air():
+    """Get the air GasMaterial shared by the convection calculations."""
+    return GasMaterial("AIR")
+
+
+@functools.lru_cache(maxsize=256)
+def _air_properties(t_kelvin, pressure):
+    """Get density, specific heat, viscosity and conductivity of air.
+
+    Args:
+        t_kelvin (float): The temperature of the air in Kelvin.
+        pressure (float): The pressure of the air in Pa.
+    """
+    air = _air()
+    return (
+        air.density_at_temperature(t_kelvin, pressure),
+        air.specific_heat_at_temperature(t_kelvin, pressure),
+        air.viscosity_at_temperature(t_kelvin, pressure),
+        air.conductivity_at_temperature(t_kelvin, pressure),
+    )
+
+
 class ConstructionBase(UmiBase):
     """A class used to store data linked to Life Cycle aspects.
 
@@ -122,6 +147,10 @@ class ConstructionBase(UmiBase):
             self.DisassemblyEnergy,
         )
 
+    def __hash__(self):
+        """Return the hash value of self."""
+        return hash(self.__key__())
+
     def __eq__(self, other):
         """Assert self is equivalent to other."""
         return isinstance(other, ConstructionBase) and self.__key__() == other.__key__()
@@ -183,7 +212,18 @@ class LayeredConstruction(ConstructionBase):
     @property
     def r_value(self):
         """Get or set the thermal resistance [K⋅m2/W] (excluding air films)."""
-        return sum([layer.r_value for layer in self.Layers])
+        return sum(layer.r_value for layer in self.Layers)
+
+    @property
+    def layer_r_values(self):
+        """Get the thermal resistance of each layer [K⋅m2/W] as an array.
+
+        Layers are ordered from outside to inside. The array is rebuilt on each
+        call since layers can be modified in place.
+        """
+        return np.fromiter(
+            (layer.r_value for layer in self.Layers), "float64", len(self.Layers)
+        )
 
     @property
     def u_value(self):
@@ -272,40 +312,110 @@ class LayeredConstruction(ConstructionBase):
             pressure (float): The average pressure in Pa.
                 Default is 101325 Pa for standard pressure at sea level.
         """
-        gas_material = GasMaterial("AIR")
-        _ray_numerator = (
-            (gas_material.density_at_temperature(t_kelvin, pressure) ** 2)
-            * (height ** 3)
-            * 9.81
-            * gas_material.specific_heat_at_temperature(t_kelvin, pressure)
-            * delta_t
-        )
-        _ray_denominator = (
-            t_kelvin
-            * gas_material.viscosity_at_temperature(t_kelvin, pressure)
-            * gas_material.conductivity_at_temperature(t_kelvin, pressure)
+        density, specific_heat, viscosity, conductivity = _air_properties(
+            t_kelvin, pressure
         )
+        _ray_numerator = (density ** 2) * (height ** 3) * 9.81 * specific_heat * delta_t
+        _ray_denominator = t_kelvin * viscosity * conductivity
         _rayleigh_h = abs(_ray_numerator / _ray_denominator)
+        nusselt = self._nusselt_scalar(angle, _rayleigh_h)
+        _conv_h = nusselt * (conductivity / height)
+        return _conv_h
+
+    def in_h_c_batch(
+        self, angles, t_kelvin=293.15, delta_t=15, height=1.0, pressure=101325
+    ):
+        """Get the indoor convective heat transfer coef. of many surfaces at once.
+
+        Vectorized counterpart of :meth:`in_h_c`: angles, delta_t and height can be
+        arrays, which are broadcast together.
+
+        Args:
+            angles (float or np.ndarray): Angles in degrees between 0 and 180.
+                0 = A horizontal surface with downward heat flow through the layer.
+                90 = A vertical surface
+                180 = A horizontal surface with upward heat flow through the layer.
+            t_kelvin (float): The average between the indoor temperature and the
+                interior surface temperature. Default is 293.15K (20C).
+            delta_t (float or np.ndarray): The temperature difference between the
+                indoor temperature and the interior surface temperature [C].
+                Default is 15C.
+            height (float or np.ndarray): The height of the surfaces in meters.
+                Default is 1.0 m, which is consistent with NFRC standards.
+            pressure (float): The average pressure in Pa.
+                Default is 101325 Pa for standard pressure at sea level.
+
+        Returns:
+            np.ndarray: The convective heat transfer coefficients [W/m2-K].
+        """
+        density, specific_heat, viscosity, conductivity = _air_properties(
+            t_kelvin, pressure
+        )
+        height = np.asarray(height, dtype="float64")
+        delta_t = np.asarray(delta_t, dtype="float64")
+        _ray_numerator = (density ** 2) * (height ** 3) * 9.81 * specific_heat * delta_t
+        _ray_denominator = t_kelvin * viscosity * conductivity
+        _rayleigh_h = np.abs(_ray_numerator / _ray_denominator)
+        return self._nusselt(angles, _rayleigh_h) * (conductivity / height)
+
+    @staticmethod
+    def _nusselt_scalar(angle, rayleigh_h):
+        """Get the Nusselt number of indoor air according to ISO 15099.
+
+        Scalar counterpart of :meth:`_nusselt`, which avoids the overhead of NumPy
+        when evaluating a single surface.
+
+        Args:
+            angle (float): An angle in degrees between 0 and 180.
+            rayleigh_h (float): The Rayleigh number based on the height of the
+                surface.
+        """
         if angle < 15:
-            nusselt = 0.13 * (_rayleigh_h ** (1 / 3))
+            return 0.13 * (rayleigh_h ** (1 / 3))
         elif angle <= 90:
-            _sin_a = math.sin(math.radians(angle))
-            _rayleigh_c = 2.5e5 * ((math.exp(0.72 * angle) / _sin_a) ** (1 / 5))
-            if _rayleigh_h < _rayleigh_c:
-                nusselt = 0.56 * ((_rayleigh_h * _sin_a) ** (1 / 4))
-            else:
-                nu_1 = 0.56 * ((_rayleigh_c * _sin_a) ** (1 / 4))
-                nu_2 = 0.13 * ((_rayleigh_h ** (1 / 3)) - (_rayleigh_c ** (1 / 3)))
-                nusselt = nu_1 + nu_2
+            sin_a = math.sin(math.radians(angle))
+            rayleigh_c = 2.5e5 * ((math.exp(0.72 * angle) / sin_a) ** (1 / 5))
+            if rayleigh_h < rayleigh_c:
+                return 0.56 * ((rayleigh_h * sin_a) ** (1 / 4))
+            nu_1 = 0.56 * ((rayleigh_c * sin_a) ** (1 / 4))
+            nu_2 = 0.13 * ((rayleigh_h ** (1 / 3)) - (rayleigh_c ** (1 / 3)))
+            return nu_1 + nu_2
         elif angle <= 179:
-            _sin_a = math.sin(math.radians(angle))
-            nusselt = 0.56 * ((_rayleigh_h * _sin_a) ** (1 / 4))
+            sin_a = math.sin(math.radians(angle))
+            return 0.56 * ((rayleigh_h * sin_a) ** (1 / 4))
         else:
-            nusselt = 0.58 * (_rayleigh_h ** (1 / 5))
-        _conv_h = nusselt * (
-            gas_material.conductivity_at_temperature(t_kelvin, pressure) / height
+            return 0.58 * (rayleigh_h ** (1 / 5))
+
+    @staticmethod
+    def _nusselt(angle, rayleigh_h):
+        """Get the Nusselt number of indoor air according to ISO 15099.
+
+        Both arguments can be scalars or arrays, which are broadcast together.
+
+        Args:
+            angle (float or np.ndarray): Angles in degrees between 0 and 180.
+            rayleigh_h (float or np.ndarray): Rayleigh numbers based on the height
+                of the surface.
+        """
+        angle = np.asarray(angle, dtype="float64")
+        rayleigh_h = np.asarray(rayleigh_h, dtype="float64")
+        sin_a = np.sin(np.radians(np.clip(angle, 1e-9, 180)))
+        rayleigh_c = 2.5e5 * ((np.exp(0.72 * angle) / sin_a) ** (1 / 5))
+        nu_vertical = np.where(
+            rayleigh_h < rayleigh_c,
+            0.56 * ((rayleigh_h * sin_a) ** (1 / 4)),
+            0.56 * ((rayleigh_c * sin_a) ** (1 / 4))
+            + 0.13 * ((rayleigh_h ** (1 / 3)) - (rayleigh_c ** (1 / 3))),
+        )
+        return np.select(
+            [angle < 15, angle <= 90, angle <= 179],
+            [
+                0.13 * (rayleigh_h ** (1 / 3)),
+                nu_vertical,
+                0.56 * ((rayleigh_h * sin_a) ** (1 / 4)),
+            ],
+            default=0.58 * (rayleigh_h ** (1 / 5)),
         )
-        return _conv_h
 
     @property
     def outside_emissivity(self):
@@ -328,6 +438,4 @@ class LayeredConstruction(ConstructionBase):
 
     def __eq__(self, other):
         """Assert self is equivalent to other."""
-        return isinstance(other, LayeredConstruction) and all(
-            [self.Layers == other.Layers]
-        )
+        return isinstance(other, LayeredConstruction) and self.Layers == other.Layers
@@ -9,6 +9,8 @@ from archetypal.template.constructions.opaque_construction import OpaqueConstruc
 class InternalMass:
     """InternalMass class."""
 
+    __slots__ = ("_surface_name", "_construction", "_total_area_exposed_to_zone")
+
     def __init__(self, surface_name, construction, total_area_exposed_to_zone):
         """Create an InternalMass object."""
         self.surface_name = surface_name
@@ -58,23 +58,20 @@ class OpaqueConstruction(LayeredConstruction):
     def r_value(self, value):
         # First, find the insulation layer
         i = self.infer_insulation_layer()
-        all_layers_except_insulation_layer = [a for a in self.Layers]
-        all_layers_except_insulation_layer.pop(i)
-        insulation_layer: MaterialLayer = self.Layers[i]
+        r_values = self.layer_r_values
+        others_r_value = np.delete(r_values, i).sum()
 
-        if value <= sum([a.r_value for a in all_layers_except_insulation_layer]):
+        if value <= others_r_value:
             raise ValueError(
-                f"Cannot set assembly r-value smaller than "
-                f"{sum([a.r_value for a in all_layers_except_insulation_layer])} "
+                f"Cannot set assembly r-value smaller than {others_r_value} "
                 f"because it would result in an insulation of a "
                 f"negative thickness. Try a higher value or changing the material "
                 f"layers instead."
             )
 
-        alpha = float(value) / self.r_value
-        new_r_value = (
-            ((alpha - 1) * sum([a.r_value for a in all_layers_except_insulation_layer]))
-        ) + alpha * insulation_layer.r_value
+        alpha = float(value) / r_values.sum()
+        new_r_value = ((alpha - 1) * others_r_value) + alpha * r_values[i]
+        insulation_layer = self.Layers[i]
         insulation_layer.r_value = new_r_value
 
     @property
@@ -158,9 +155,50 @@ class OpaqueConstruction(LayeredConstruction):
 
         return sri
 
+    @classmethod
+    def u_factor_batch(cls, constructions):
+        """Get the U-factor [W/(m2⋅K)] of many constructions at once.
+
+        Equivalent to reading :attr:`u_factor` on each construction (up to floating
+        point rounding), but the layer R-values of all constructions are gathered in
+        one flat array and summed per construction in a single NumPy reduction.
+
+        Args:
+            constructions (list of OpaqueConstruction): The constructions.
+
+        Returns:
+            np.ndarray: The U-factor of each construction, in the same order.
+        """
+        if not constructions:
+            return np.empty(0)
+        n_layers = [len(construction.Layers) for construction in constructions]
+        layer_r_values = np.fromiter(
+            (
+                layer.r_value
+                for construction in constructions
+                for layer in construction.Layers
+            ),
+            "float64",
+            sum(n_layers),
+        )
+        # Each construction has at least one layer, so no segment is empty.
+        offsets = np.cumsum([0] + n_layers[:-1])
+        out_h = np.fromiter(
+            (construction.out_h_simple() for construction in constructions),
+            "float64",
+            len(n_layers),
+        )
+        in_h = np.fromiter(
+            (construction.in_h_simple() for construction in constructions),
+            "float64",
+            len(n_layers),
+        )
+        r_factor = 1 / out_h + np.add.reduceat(layer_r_values, offsets) + 1 / in_h
+        return 1 / r_factor
+
     def infer_insulation_layer(self):
         """Return the material layer index that corresponds to the insulation layer."""
-        return self.Layers.index(max(self.Layers, key=lambda x: x.r_value))
+        return int(self.layer_r_values.argmax())
 
     def combine(self, other, method="dominant_wall", allow_duplicates=False):
         """Combine two OpaqueConstruction together.
@@ -542,7 +580,7 @@ class OpaqueConstruction(LayeredConstruction):
         if not isinstance(other, OpaqueConstruction):
             return NotImplemented
         else:
-            return all([self.Layers == other.Layers])
+            return self.Layers == other.Layers
 
     def __copy__(self):
         """Create a copy of self."""
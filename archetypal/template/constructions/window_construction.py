@@ -564,16 +564,10 @@ class WindowConstruction(LayeredConstruction):
         if not isinstance(other, WindowConstruction):
             return NotImplemented
         else:
-            return all(
-                [
-                    self.Category == other.Category,
-                    self.AssemblyCarbon == other.AssemblyCarbon,
-                    self.AssemblyCost == other.AssemblyCost,
-                    self.AssemblyEnergy == other.AssemblyEnergy,
-                    self.DisassemblyCarbon == other.DisassemblyCarbon,
-                    self.DisassemblyEnergy == other.DisassemblyEnergy,
-                    self.Layers == other.Layers,
-                ]
+            return (
+                self.Category == other.Category
+                and self.__key__() == other.__key__()
+                and self.Layers == other.Layers
             )
 
     def __copy__(self):
@@ -1,6 +1,7 @@
 """archetypal OpaqueMaterial."""
 
 import collections
+import sys
 
 import numpy as np
 from sigfig import round
@@ -22,6 +23,7 @@ class NoMassMaterial(MaterialBase):
         "Smooth",
         "VerySmooth",
     )
+    _ROUGHNESS_SET = frozenset(_ROUGHNESS_TYPES)
 
     __slots__ = (
         "_roughness",
@@ -98,11 +100,11 @@ class NoMassMaterial(MaterialBase):
 
     @Roughness.setter
     def Roughness(self, value):
-        assert value in self._ROUGHNESS_TYPES, (
+        assert value in self._ROUGHNESS_SET, (
             f"Invalid value '{value}' for material roughness. Roughness must be one "
             f"of the following:\n{self._ROUGHNESS_TYPES}"
         )
-        self._roughness = value
+        self._roughness = sys.intern(str(value))
 
     @property
     def SolarAbsorptance(self):
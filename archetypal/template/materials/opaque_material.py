@@ -1,15 +1,32 @@
 """archetypal OpaqueMaterial."""
 
-import collections
+import functools
+import sys
 
+import numpy as np
 from eppy.bunch_subclass import EpBunch
 from validator_collection import validators
 
 from archetypal.template.materials import GasMaterial
 from archetypal.template.materials.material_base import MaterialBase
+from archetypal.template.umi_base import UmiBase
 from archetypal.utils import log
 
 
+@functools.lru_cache(maxsize=None)
+def _gas_properties():
+    """Get the properties of each gas type, keyed by lower-case gas name.
+
+    The GasMaterial objects are built once, on first use, and their mappings are
+    shared by every Material:AirGap conversion. The "Name" key is left out.
+    """
+    gas_prop = {}
+    for gas_name in GasMaterial._GASTYPES:
+        properties = GasMaterial(gas_name).mapping()
+        gas_prop[properties.pop("Name").lower()] = properties
+    return gas_prop
+
+
 class OpaqueMaterial(MaterialBase):
     """Use this component to create a custom opaque material.
 
@@ -24,6 +41,23 @@ class OpaqueMaterial(MaterialBase):
         "Smooth",
         "VerySmooth",
     )
+    _ROUGHNESS_SET = frozenset(_ROUGHNESS_TYPES)
+
+    _WEIGHTED_ATTRS = (
+        "Conductivity",
+        "SolarAbsorptance",
+        "ThermalEmittance",
+        "VisibleAbsorptance",
+        "TransportCarbon",
+        "TransportDistance",
+        "TransportEnergy",
+        "SubstitutionTimestep",
+        "Cost",
+        "Density",
+        "EmbodiedCarbon",
+        "EmbodiedEnergy",
+        "MoistureDiffusionResistance",
+    )
 
     __slots__ = (
         "_roughness",
@@ -151,11 +185,11 @@ class OpaqueMaterial(MaterialBase):
 
     @Roughness.setter
     def Roughness(self, value):
-        assert value in self._ROUGHNESS_TYPES, (
+        assert value in self._ROUGHNESS_SET, (
             f"Invalid value '{value}' for material roughness. Roughness must be one "
             f"of the following:\n{self._ROUGHNESS_TYPES}"
         )
-        self._roughness = value
+        self._roughness = sys.intern(str(value))
 
     @property
     def SolarAbsorptance(self):
@@ -199,7 +233,7 @@ class OpaqueMaterial(MaterialBase):
 
     @VisibleAbsorptance.setter
     def VisibleAbsorptance(self, value):
-        if value == "" or value is None or value is None:
+        if value == "" or value is None:
             value = 0.7
         self._visible_absorptance = validators.float(
             value, minimum=0, maximum=1, allow_empty=True
@@ -267,31 +301,33 @@ class OpaqueMaterial(MaterialBase):
             )
             weights = [self.Density, other.Density]
 
+        # Average the scalar attributes in one pass. When one side is NaN, the
+        # other side is kept.
+        values = np.array(
+            [
+                [getattr(obj, attr) for attr in self._WEIGHTED_ATTRS]
+                for obj in (self, other)
+            ],
+            dtype=float,
+        )
+        if not np.any(weights):
+            weights = [1, 1]
+        means = np.average(values, axis=0, weights=weights)
+        means = np.where(
+            np.isnan(values[0]),
+            values[1],
+            np.where(np.isnan(values[1]), values[0], means),
+        )
+
         meta = self._get_predecessors_meta(other)
         new_obj = OpaqueMaterial(
             **meta,
-            Conductivity=self.float_mean(other, "Conductivity", weights),
+            **dict(zip(self._WEIGHTED_ATTRS, means.tolist())),
             Roughness=self._str_mean(other, attr="Roughness", append=False),
-            SolarAbsorptance=self.float_mean(other, "SolarAbsorptance", weights),
             SpecificHeat=self.float_mean(other, "SpecificHeat"),
-            ThermalEmittance=self.float_mean(other, "ThermalEmittance", weights),
-            VisibleAbsorptance=self.float_mean(other, "VisibleAbsorptance", weights),
-            TransportCarbon=self.float_mean(other, "TransportCarbon", weights),
-            TransportDistance=self.float_mean(other, "TransportDistance", weights),
-            TransportEnergy=self.float_mean(other, "TransportEnergy", weights),
             SubstitutionRatePattern=self.float_mean(
                 other, "SubstitutionRatePattern", weights=None
             ),
-            SubstitutionTimestep=self.float_mean(
-                other, "SubstitutionTimestep", weights
-            ),
-            Cost=self.float_mean(other, "Cost", weights),
-            Density=self.float_mean(other, "Density", weights),
-            EmbodiedCarbon=self.float_mean(other, "EmbodiedCarbon", weights),
-            EmbodiedEnergy=self.float_mean(other, "EmbodiedEnergy", weights),
-            MoistureDiffusionResistance=self.float_mean(
-                other, "MoistureDiffusionResistance", weights
-            ),
         )
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
@@ -302,33 +338,29 @@ class OpaqueMaterial(MaterialBase):
 
     def to_dict(self):
         """Return OpaqueMaterial dictionary representation."""
-        self.validate()  # Validate object before trying to get json format
-
-        data_dict = collections.OrderedDict()
-
-        data_dict["$id"] = str(self.id)
-        data_dict["MoistureDiffusionResistance"] = self.MoistureDiffusionResistance
-        data_dict["Roughness"] = self.Roughness
-        data_dict["SolarAbsorptance"] = self.SolarAbsorptance
-        data_dict["SpecificHeat"] = self.SpecificHeat
-        data_dict["ThermalEmittance"] = self.ThermalEmittance
-        data_dict["VisibleAbsorptance"] = self.VisibleAbsorptance
-        data_dict["Conductivity"] = self.Conductivity
-        data_dict["Cost"] = self.Cost
-        data_dict["Density"] = self.Density
-        data_dict["EmbodiedCarbon"] = self.EmbodiedCarbon
-        data_dict["EmbodiedEnergy"] = self.EmbodiedEnergy
-        data_dict["SubstitutionRatePattern"] = self.SubstitutionRatePattern
-        data_dict["SubstitutionTimestep"] = self.SubstitutionTimestep
-        data_dict["TransportCarbon"] = self.TransportCarbon
-        data_dict["TransportDistance"] = self.TransportDistance
-        data_dict["TransportEnergy"] = self.TransportEnergy
-        data_dict["Category"] = self.Category
-        data_dict["Comments"] = validators.string(self.Comments, allow_empty=True)
-        data_dict["DataSource"] = self.DataSource
-        data_dict["Name"] = self.Name
-
-        return data_dict
+        return {
+            "$id": str(self.id),
+            "MoistureDiffusionResistance": self.MoistureDiffusionResistance,
+            "Roughness": self.Roughness,
+            "SolarAbsorptance": self.SolarAbsorptance,
+            "SpecificHeat": self.SpecificHeat,
+            "ThermalEmittance": self.ThermalEmittance,
+            "VisibleAbsorptance": self.VisibleAbsorptance,
+            "Conductivity": self.Conductivity,
+            "Cost": self.Cost,
+            "Density": self.Density,
+            "EmbodiedCarbon": self.EmbodiedCarbon,
+            "EmbodiedEnergy": self.EmbodiedEnergy,
+            "SubstitutionRatePattern": self.SubstitutionRatePattern,
+            "SubstitutionTimestep": self.SubstitutionTimestep,
+            "TransportCarbon": self.TransportCarbon,
+            "TransportDistance": self.TransportDistance,
+            "TransportEnergy": self.TransportEnergy,
+            "Category": self.Category,
+            "Comments": validators.string(self.Comments, allow_empty=True),
+            "DataSource": self.DataSource,
+            "Name": self.Name,
+        }
 
     @classmethod
     def from_dict(cls, data, **kwargs):
@@ -395,7 +427,8 @@ class OpaqueMaterial(MaterialBase):
             epbunch (EpBunch): EP-Construction object
             **kwargs:
         """
-        if epbunch.key.upper() == "MATERIAL":
+        key = epbunch.key.upper()
+        if key == "MATERIAL":
             return cls(
                 Conductivity=epbunch.Conductivity,
                 Density=epbunch.Density,
@@ -407,7 +440,7 @@ class OpaqueMaterial(MaterialBase):
                 Name=epbunch.Name,
                 **kwargs,
             )
-        elif epbunch.key.upper() == "MATERIAL:NOMASS":
+        elif key == "MATERIAL:NOMASS":
             # Assume properties of air.
             return cls(
                 Conductivity=0.02436,  # W/mK, dry air at 0 °C and 100 kPa
@@ -418,37 +451,23 @@ class OpaqueMaterial(MaterialBase):
                 ThermalEmittance=epbunch.Thermal_Absorptance,
                 VisibleAbsorptance=epbunch.Visible_Absorptance,
                 Name=epbunch.Name,
-                _key=epbunch.key.upper(),
+                _key=key,
                 **kwargs,
             )
-        elif epbunch.key.upper() == "MATERIAL:AIRGAP":
-            gas_prop = {
-                obj.Name.upper(): obj.mapping()
-                for obj in [GasMaterial(gas_name) for gas_name in GasMaterial._GASTYPES]
-            }
-            for gasname, properties in gas_prop.items():
-                if gasname.lower() in epbunch.Name.lower():
-                    thickness = properties["Conductivity"] * epbunch.Thermal_Resistance
-                    properties.pop("Name")
-                    return cls(
-                        Name=epbunch.Name,
-                        Thickness=thickness,
-                        SpecificHeat=100.5,
-                        _key=epbunch.key.upper(),
-                        **properties,
-                    )
-                else:
-                    thickness = (
-                        gas_prop["AIR"]["Conductivity"] * epbunch.Thermal_Resistance
-                    )
-                    properties.pop("Name")
-                    return cls(
-                        Name=epbunch.Name,
-                        Thickness=thickness,
-                        SpecificHeat=100.5,
-                        _key=epbunch.key.upper(),
-                        **gas_prop["AIR"],
-                    )
+        elif key == "MATERIAL:AIRGAP":
+            name = epbunch.Name.lower()
+            for gasname, props in _gas_properties().items():
+                if gasname in name:
+                    break
+            else:
+                props = _gas_properties()["air"]
+            return cls(
+                Name=epbunch.Name,
+                Thickness=props["Conductivity"] * epbunch.Thermal_Resistance,
+                SpecificHeat=100.5,
+                _key=key,
+                **props,
+            )
         else:
             raise NotImplementedError(
                 "Material '{}' of type '{}' is not yet "
@@ -510,22 +529,6 @@ class OpaqueMaterial(MaterialBase):
                 Visible_Absorptance=self.VisibleAbsorptance,
             )
 
-    def validate(self):
-        """Validate object and fill in missing values.
-
-        Hint:
-            Some OpaqueMaterial don't have a default value, therefore an empty string
-            is parsed. This breaks the UmiTemplate Editor, therefore we set a value
-            on these attributes (if necessary) in this validation step.
-        """
-        if getattr(self, "SolarAbsorptance") == "":
-            setattr(self, "SolarAbsorptance", 0.7)
-        if getattr(self, "ThermalEmittance") == "":
-            setattr(self, "ThermalEmittance", 0.9)
-        if getattr(self, "VisibleAbsorptance") == "":
-            setattr(self, "VisibleAbsorptance", 0.7)
-        return self
-
     def mapping(self, validate=True):
         """Get a dict based on the object properties, useful for dict repr.
 
@@ -584,31 +587,50 @@ class OpaqueMaterial(MaterialBase):
         """Assert self is equivalent to other."""
         if not isinstance(other, OpaqueMaterial):
             return NotImplemented
-        else:
-            return self.__key__() == other.__key__()
+        if self is other:
+            return True
+        return self.__key__() == other.__key__()
 
     def __key__(self):
         """Get a tuple of attributes. Useful for hashing and comparing."""
+        # Read the slots directly: the properties only return them, and this is
+        # called for every comparison when deduplicating materials.
         return (
-            self.Conductivity,
-            self.SpecificHeat,
-            self.SolarAbsorptance,
-            self.ThermalEmittance,
-            self.VisibleAbsorptance,
-            self.Roughness,
-            self.Cost,
-            self.Density,
-            self.MoistureDiffusionResistance,
-            self.EmbodiedCarbon,
-            self.EmbodiedEnergy,
-            self.TransportCarbon,
-            self.TransportDistance,
-            self.TransportEnergy,
-            self.SubstitutionRatePattern,
-            self.SubstitutionTimestep,
+            self._conductivity,
+            self._specific_heat,
+            self._solar_absorptance,
+            self._thermal_emittance,
+            self._visible_absorptance,
+            self._roughness,
+            self._cost,
+            self._density,
+            self._moisture_diffusion_resistance,
+            self._embodied_carbon,
+            self._embodied_energy,
+            self._transport_carbon,
+            self._transport_distance,
+            self._transport_energy,
+            self._substitution_rate_pattern,
+            self._substitution_timestep,
         )
 
     def __copy__(self):
-        """Create a copy of self."""
-        new_om = self.__class__(**self.mapping())
+        """Create a copy of self.
+
+        The material properties were validated when they were set on self, so they
+        are copied as is instead of going through the validating setters again.
+        """
+        new_om = self.__class__.__new__(self.__class__)
+        UmiBase.__init__(
+            new_om,
+            self.Name,
+            Category=self.Category,
+            Comments=self.Comments,
+            DataSource=self.DataSource,
+        )
+        for slot in MaterialBase.__slots__ + OpaqueMaterial.__slots__:
+            value = getattr(self, slot)
+            if isinstance(value, list):
+                value = list(value)  # do not share mutable values with self
+            setattr(new_om, slot, value)
         return new_om
@@ -3,6 +3,7 @@
 import itertools
 import math
 import re
+import sys
 from collections.abc import Hashable, MutableSet
 
 import numpy as np
@@ -121,7 +122,9 @@ class UmiBase(object):
 
     @DataSource.setter
     def DataSource(self, value):
-        self._datasource = validators.string(value, coerce_value=True, allow_empty=True)
+        value = validators.string(value, coerce_value=True, allow_empty=True)
+        # Data sources are shared by many objects; intern them to share one string.
+        self._datasource = value if value is None else sys.intern(str(value))
 
     @property
     def Category(self):
@@ -133,7 +136,7 @@ class UmiBase(object):
         value = validators.string(value, coerce_value=True, allow_empty=True)
         if value is None:
             value = ""
-        self._category = value
+        self._category = sys.intern(str(value))
 
     @property
     def Comments(self):
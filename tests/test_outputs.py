@@ -54,6 +54,20 @@ class TestOutput:
         with pytest.raises(AssertionError):
             outputs.unit_conversion = "IP"
 
+    def test_output_variables_after_add(self, idf):
+        """Test that the sorted outputs are refreshed when outputs are added."""
+        outputs = Outputs(idf)
+        outputs.output_variables = ["Zone Mean Air Temperature"]
+        assert outputs.output_variables == ("Zone Mean Air Temperature",)
+
+        outputs.add_custom(
+            [{"key": "OUTPUT:VARIABLE", "Variable_Name": "Site Outdoor Air Humidity"}]
+        )
+        assert outputs.output_variables == (
+            "Site Outdoor Air Humidity",
+            "Zone Mean Air Temperature",
+        )
+
     def test_add_basics(self, idf):
         """Test the Output add_basics method"""
         outputs = Outputs(idf).add_basics()
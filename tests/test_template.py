@@ -655,6 +655,10 @@ class TestOpaqueMaterial:
         assert om is not om_3
         assert om == om_3
 
+        # list attributes of a copy are not shared with the original
+        om_3.SubstitutionRatePattern.append(0.5)
+        assert om.SubstitutionRatePattern != om_3.SubstitutionRatePattern
+
     def test_material_new(self):
         gypsum = OpaqueMaterial(
             Name="GP01 GYPSUM",
@@ -1150,6 +1154,25 @@ class TestOpaqueConstruction:
         """test r_value and u_value properties."""
         assert 1 / construction_a.r_value == construction_a.u_value
 
+    def test_u_factor_batch(self, facebrick_and_concrete, construction_b):
+        """Test u_factor_batch() against the u_factor of each construction."""
+        constructions = [facebrick_and_concrete, construction_b]
+        u_factors = OpaqueConstruction.u_factor_batch(constructions)
+        assert u_factors.tolist() == pytest.approx([c.u_factor for c in constructions])
+        assert OpaqueConstruction.u_factor_batch([]).size == 0
+
+    def test_in_h_c_batch(self, construction_a):
+        """Test in_h_c_batch() against in_h_c() of each surface."""
+        angles = np.array([0, 10, 15, 45, 90, 120, 179, 179.5, 180])
+        heights = np.linspace(0.5, 4, len(angles))
+        h_c = construction_a.in_h_c_batch(angles, delta_t=10, height=heights)
+        assert h_c.tolist() == pytest.approx(
+            [
+                construction_a.in_h_c(delta_t=10, height=height, angle=angle)
+                for angle, height in zip(angles, heights)
+            ]
+        )
+
     def test_add_opaque_construction(self, construction_a, construction_b):
         """Test __add__() for OpaqueConstruction."""
         oc_c = OpaqueConstruction.combine(
@@ -0,0 +1,52 @@
+import os
+
+from path import Path
+
+from archetypal.eplus_interface.transition import _link_tree, _populate
+
+
+class TestLinkTree:
+    """Tests for populating the running directory of the transition programs."""
+
+    def test_install_untouched(self, tmp_path):
+        """Test that a transition writing to its running directory does not modify
+        the IDFVersionUpdater folder it was populated from."""
+        install = tmp_path / "IDFVersionUpdater"
+        install.mkdir()
+        program = install / "Transition-V9-1-0-to-V9-2-0"
+        program.write_text("program")
+        idd = install / "V9-1-0-Energy+.idd"
+        idd.write_text("idd")
+        report = install / "Report Variables 9-1-0 to 9-2-0.csv"
+        report.write_text("report")
+        before = {f.name: f.read_text() for f in install.iterdir()}
+
+        run_dir = tmp_path / "run"
+        _link_tree(install, run_dir)
+
+        # The programs and idd files are shared with the installation...
+        assert (run_dir / program.name).read_text() == "program"
+        assert (run_dir / idd.name).read_text() == "idd"
+        # ...but any other file is a copy.
+        assert not os.path.samefile(run_dir / report.name, report)
+
+        # Mutate the running directory like a transition would.
+        with open(run_dir / report.name, "a") as f:
+            f.write(" modified")
+        (run_dir / "in.idfnew").write_text("transitioned")
+        os.replace(run_dir / "in.idfnew", run_dir / "in.idf")
+
+        assert {f.name: f.read_text() for f in install.iterdir()} == before
+
+    def test_repopulate_partly_cleaned(self, tmp_path):
+        """Test that a running directory missing some transition programs is
+        populated again, even though it was marked as ready."""
+        install = Path(tmp_path / "IDFVersionUpdater").makedirs_p()
+        for name in ("Transition-V9-0-0-to-V9-1-0", "Transition-V9-1-0-to-V9-2-0"):
+            (install / name).write_text("program")
+
+        run_dir = Path(tmp_path / "run").makedirs_p()
+        assert len(_populate(install, run_dir)) == 2
+
+        (run_dir / "Transition-V9-1-0-to-V9-2-0").unlink()  # partly cleaned
+        assert len(_populate(install, run_dir)) == 2